@@ -6,7 +6,7 @@ from .polygons import OrthoPoly
 from .transformations import rotate_and_align_top_left, rotate_rect_generic
 from .collision import polygons_intersect
 from .types import Point, RectCM, BoundingBox
-from .render_helpers import vertices_externos_px, build_tile_orthopoly_and_edges_cm
+from .render_helpers import vertices_externos_px, build_tile_orthopoly_and_edges_cm, build_aligned_tile_cm
 
 __all__ = [
     'OrthoPoly',
@@ -17,5 +17,6 @@ __all__ = [
     'RectCM',
     'BoundingBox',
     'vertices_externos_px',
-    'build_tile_orthopoly_and_edges_cm'
+    'build_tile_orthopoly_and_edges_cm',
+    'build_aligned_tile_cm'
 ]
\ No newline at end of file
@@ -3,27 +3,78 @@ Collision detection functions for geometric operations.
 """
 
 import pyclipper
-from typing import List
+from typing import List, Optional, Tuple
 
 from .polygons import OrthoPoly
-from .types import Point
+from .types import Point, IPoint, BoundingBox
+from .utils import cm_to_i
 
 
-def polygons_intersect(polyA: OrthoPoly, polyB: OrthoPoly, clearance_cm: float = 0.0) -> bool:
+def clearance_paths_i(poly: OrthoPoly, clearance_cm: float = 0.0) -> List[List[IPoint]]:
     """
-    Check polygon-polygon collision with clearance support.
+    Integer paths of a polygon grown by the clearance, as used for collisions.
     
     Args:
-        polyA: First polygon
-        polyB: Second polygon  
-        clearance_cm: Minimum separation distance (>0)
+        poly: Input polygon
+        clearance_cm: Minimum separation distance
         
     Returns:
-        True if polygons intersect (considering clearance)
+        Offset paths, or the plain paths when there is no clearance
+    """
+    return poly.offset_paths_i(clearance_cm) if clearance_cm != 0.0 else poly.to_paths_i()
+
+
+def paths_aabb_i(paths: List[List[IPoint]]) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Integer bounding box of a set of paths.
+    
+    Args:
+        paths: Paths in integer coordinates
+        
+    Returns:
+        (min_x, min_y, max_x, max_y), or None for no points
+    """
+    xs = [x for path in paths for x, _ in path]
+    if not xs:
+        return None
+    ys = [y for path in paths for _, y in path]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def aabb_may_intersect(aabb_i: Optional[Tuple[int, int, int, int]], aabb_cm: BoundingBox) -> bool:
+    """
+    Cheap precheck before paths_intersect.
+    
+    The cm box is rounded like the vertices it bounds, so a False result
+    means the exact test could not find an overlap either.
+    
+    Args:
+        aabb_i: Integer bounding box of the fixed paths (paths_aabb_i)
+        aabb_cm: Bounding box in cm of the candidate polygon
+        
+    Returns:
+        False if the boxes are strictly separated
     """
-    pathsA = polyA.offset_paths_i(clearance_cm) if clearance_cm != 0.0 else polyA.to_paths_i()
-    pathsB = polyB.to_paths_i()
+    if aabb_i is None:
+        return False
+    minx, miny = cm_to_i((aabb_cm[0], aabb_cm[1]))
+    maxx, maxy = cm_to_i((aabb_cm[2], aabb_cm[3]))
+    return not (maxx < aabb_i[0] or aabb_i[2] < minx or maxy < aabb_i[1] or aabb_i[3] < miny)
+
+
+def paths_intersect(pathsA: List[List[IPoint]], pathsB: List[List[IPoint]]) -> bool:
+    """
+    Check whether two sets of integer paths overlap.
+    
+    Lets a search convert a fixed polygon once and test many candidates.
     
+    Args:
+        pathsA: Subject paths (already offset by any clearance)
+        pathsB: Clip paths
+        
+    Returns:
+        True if the paths intersect
+    """
     if not pathsA or not pathsB:
         return False
         
@@ -35,6 +86,21 @@ def polygons_intersect(polyA: OrthoPoly, polyB: OrthoPoly, clearance_cm: float =
     return len(inter) > 0
 
 
+def polygons_intersect(polyA: OrthoPoly, polyB: OrthoPoly, clearance_cm: float = 0.0) -> bool:
+    """
+    Check polygon-polygon collision with clearance support.
+    
+    Args:
+        polyA: First polygon
+        polyB: Second polygon  
+        clearance_cm: Minimum separation distance (>0)
+        
+    Returns:
+        True if polygons intersect (considering clearance)
+    """
+    return paths_intersect(clearance_paths_i(polyA, clearance_cm), polyB.to_paths_i())
+
+
 def calculate_minimum_clearance(polyA: OrthoPoly, polyB: OrthoPoly, max_clearance: float = 10.0) -> float:
     """
     Calculate minimum clearance between two polygons using binary search.
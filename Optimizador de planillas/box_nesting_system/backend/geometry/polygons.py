@@ -4,16 +4,49 @@ Orthogonal polygon class with robust geometric operations.
 
 import pyclipper
 import logging
+from functools import lru_cache
 from typing import List, Optional, Tuple, Dict, Any
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainterPath
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPainterPath, QPolygonF
 from PySide6.QtWidgets import QGraphicsScene
 
 from .types import Point, IPoint, RectCM, BoundingBox, PolygonData
-from .utils import cm_to_i, i_to_cm  # Cambiar importación
+from .utils import cm_to_i, i_to_cm, cm_to_i_path, i_to_cm_path  # Cambiar importación
 from backend.utils.constants import SCALE_INT
 
+
+@lru_cache(maxsize=64)
+def _union_rects_cm(rects_cm: Tuple[RectCM, ...]) -> Tuple[List[Point], List[List[Point]]]:
+    """
+    Pyclipper union behind OrthoPoly.from_rects_cm, memoized per rect tuple.
+    
+    The returned lists are shared by every hit and must not be mutated;
+    from_rects_cm copies them into the new polygon.
+    """
+    paths: List[List[IPoint]] = []
+    solid: List[List[IPoint]] = []
+    for x, y, w, h in rects_cm:
+        # Round each edge once; the corners share them
+        ix, iy = cm_to_i((x, y))
+        ix2, iy2 = cm_to_i((x + w, y + h))
+        path = [(ix, iy), (ix2, iy), (ix2, iy2), (ix, iy2)]
+        paths.append(path)
+        # Zero-area pieces (e.g. an unused ceja) add nothing to the union
+        if ix != ix2 and iy != iy2:
+            solid.append(path)
+
+    pc = pyclipper.Pyclipper()
+    pc.AddPaths(solid or paths, pyclipper.PT_SUBJECT, True)
+    sol = pc.Execute(pyclipper.CT_UNION, pyclipper.PFT_NONZERO, pyclipper.PFT_NONZERO)
+
+    if not sol:
+        return [], []
+
+    sol = sorted(sol, key=lambda p: abs(pyclipper.Area(p)), reverse=True)
+    return i_to_cm_path(sol[0]), [i_to_cm_path(p) for p in sol[1:]]
+
+
 class OrthoPoly:
     """
     Represents an orthogonal polygon with robust geometric operations.
@@ -47,23 +80,9 @@ class OrthoPoly:
         Returns:
             OrthoPoly: Unified polygon from rectangle union
         """
-        paths: List[List[IPoint]] = []
-        for x, y, w, h in rects_cm:
-            x2, y2 = x + w, y + h
-            p = [cm_to_i((x, y)), cm_to_i((x2, y)), cm_to_i((x2, y2)), cm_to_i((x, y2))]
-            paths.append(p)
-
-        pc = pyclipper.Pyclipper()
-        pc.AddPaths(paths, pyclipper.PT_SUBJECT, True)
-        sol = pc.Execute(pyclipper.CT_UNION, pyclipper.PFT_NONZERO, pyclipper.PFT_NONZERO)
-
-        if not sol:
-            return OrthoPoly([], [])
-
-        sol = sorted(sol, key=lambda p: abs(pyclipper.Area(p)), reverse=True)
-        outer = [i_to_cm(pt) for pt in sol[0]]
-        holes = [[i_to_cm(pt) for pt in p] for p in sol[1:]]
-        return OrthoPoly(outer, holes)
+        # Identical rect lists (same tile rebuilt during a search) reuse the union
+        outer, holes = _union_rects_cm(tuple(map(tuple, rects_cm)))
+        return OrthoPoly(outer, [h[:] for h in holes])
 
     def aabb(self) -> BoundingBox:
         """
@@ -72,8 +91,7 @@ class OrthoPoly:
         Returns:
             BoundingBox: (min_x, min_y, max_x, max_y)
         """
-        xs = [p[0] for p in self.outer]
-        ys = [p[1] for p in self.outer]
+        xs, ys = zip(*self.outer)
         return (min(xs), min(ys), max(xs), max(ys))
 
     def translate(self, dx: float, dy: float) -> None:
@@ -87,6 +105,23 @@ class OrthoPoly:
         self.outer = [(x + dx, y + dy) for x, y in self.outer]
         self.holes = [[(x + dx, y + dy) for x, y in h] for h in self.holes]
 
+    def translated(self, dx: float, dy: float) -> "OrthoPoly":
+        """
+        Create a translated copy of the polygon.
+        
+        Equivalent to copying and calling translate, but the shifted
+        vertex lists are built once instead of copied first.
+        
+        Args:
+            dx: X offset in cm
+            dy: Y offset in cm
+            
+        Returns:
+            OrthoPoly: Translated copy
+        """
+        return OrthoPoly([(x + dx, y + dy) for x, y in self.outer],
+                         [[(x + dx, y + dy) for x, y in h] for h in self.holes])
+
     def rotated_copy(self, rot: int) -> "OrthoPoly":
         """
         Create a rotated copy of the polygon.
@@ -100,21 +135,19 @@ class OrthoPoly:
         Raises:
             ValueError: If rotation is not multiple of 90
         """
-        # Importación local para evitar ciclo
-        from .transformations import rotate_point_90cw, rotate_point_180, rotate_point_270cw
-        
         rot = rot % 360
+        # Same mappings as rotate_point_90cw/_180/_270cw, inlined
         if rot == 0:
             return OrthoPoly(self.outer[:], [h[:] for h in self.holes])
         elif rot == 90:
-            return OrthoPoly([rotate_point_90cw(p) for p in self.outer],
-                             [[rotate_point_90cw(p) for p in h] for h in self.holes])
+            return OrthoPoly([(y, -x) for x, y in self.outer],
+                             [[(y, -x) for x, y in h] for h in self.holes])
         elif rot == 180:
-            return OrthoPoly([rotate_point_180(p) for p in self.outer],
-                             [[rotate_point_180(p) for p in h] for h in self.holes])
+            return OrthoPoly([(-x, -y) for x, y in self.outer],
+                             [[(-x, -y) for x, y in h] for h in self.holes])
         elif rot == 270:
-            return OrthoPoly([rotate_point_270cw(p) for p in self.outer],
-                             [[rotate_point_270cw(p) for p in h] for h in self.holes])
+            return OrthoPoly([(-y, x) for x, y in self.outer],
+                             [[(-y, x) for x, y in h] for h in self.holes])
         else:
             raise ValueError("Rotation must be multiple of 90 degrees")
 
@@ -125,11 +158,29 @@ class OrthoPoly:
         Returns:
             List of paths in integer coordinates
         """
+        paths: List[List[IPoint]] = [cm_to_i_path(self.outer)] if self.outer else []
+        paths.extend(cm_to_i_path(h) for h in self.holes)
+        return paths
+
+    def translated_paths_i(self, dx: float, dy: float) -> List[List[IPoint]]:
+        """
+        Integer paths of the polygon translated by (dx, dy).
+        
+        Same result as translated(dx, dy).to_paths_i() without building
+        the intermediate polygon and cm vertex lists.
+        
+        Args:
+            dx: X offset in cm
+            dy: Y offset in cm
+            
+        Returns:
+            List of paths in integer coordinates
+        """
+        scale = SCALE_INT
         paths: List[List[IPoint]] = []
-        if self.outer:
-            paths.append([cm_to_i(p) for p in self.outer])
-        for h in self.holes:
-            paths.append([cm_to_i(p) for p in h])
+        for ring in ([self.outer] if self.outer else []) + self.holes:
+            # round() of a float already returns an int
+            paths.append([(round((x + dx) * scale), round((y + dy) * scale)) for x, y in ring])
         return paths
 
     def offset_paths_i(self, delta_cm: float) -> List[List[IPoint]]:
@@ -142,12 +193,22 @@ class OrthoPoly:
         Returns:
             List of offset paths in integer coordinates
         """
+        return self.offset_many([delta_cm])[0]
+
+    def offset_many(self, deltas_cm: List[float]) -> List[List[List[IPoint]]]:
+        """
+        Apply several offsets, adding the paths to pyclipper only once.
+        
+        Args:
+            deltas_cm: Offset distances in cm, as in offset_paths_i
+            
+        Returns:
+            One list of offset paths per delta, in the same order
+        """
         pco = pyclipper.PyclipperOffset(miter_limit=2.0, arc_tolerance=0.0)
-        if self.outer:
-            pco.AddPath([cm_to_i(p) for p in self.outer], pyclipper.JT_MITER, pyclipper.ET_CLOSEDPOLYGON)
-        for h in self.holes:
-            pco.AddPath([cm_to_i(p) for p in h], pyclipper.JT_MITER, pyclipper.ET_CLOSEDPOLYGON)
-        return pco.Execute(delta_cm * SCALE_INT)
+        for path in self.to_paths_i():
+            pco.AddPath(path, pyclipper.JT_MITER, pyclipper.ET_CLOSEDPOLYGON)
+        return [pco.Execute(d * SCALE_INT) for d in deltas_cm]
 
     def to_qpath(self, px_per_cm: float, fill_rule_odd_even: bool = True) -> QPainterPath:
         """
@@ -162,18 +223,12 @@ class OrthoPoly:
         """
         path = QPainterPath()
         
-        def add_loop(loop: List[Point]):
-            if not loop:
-                return
-            x0, y0 = loop[0]
-            path.moveTo(x0 * px_per_cm, y0 * px_per_cm)
-            for x, y in loop[1:]:
-                path.lineTo(x * px_per_cm, y * px_per_cm)
-            path.closeSubpath()
-            
-        add_loop(self.outer)
-        for h in self.holes:
-            add_loop(h)
+        # One addPolygon per ring instead of moveTo + lineTo per vertex;
+        # the resulting path elements are the same
+        for loop in (self.outer, *self.holes):
+            if loop:
+                path.addPolygon(QPolygonF([QPointF(x * px_per_cm, y * px_per_cm) for x, y in loop]))
+                path.closeSubpath()
             
         path.setFillRule(Qt.OddEvenFill if fill_rule_odd_even else Qt.WindingFill)
         return path
@@ -2,11 +2,16 @@
 Helper functions for rendering and visualization geometry operations.
 """
 
+from functools import lru_cache
 from typing import List, Dict, Tuple
-from backend.models.parameters import PlanoParams
+from backend.models.parameters import PlanoParams, ShapeKind, shape_kind_from_name
 from .polygons import OrthoPoly
+from .transformations import rotate_and_align_top_left
 from .types import RectCM
 
+# Plain ints for the per-shape dispatch in vertices_externos_px
+_OTHER, _CARA1, _CARA4, _CEJA_SUP, _CEJA_INF, _CEJA_LAT = map(int, ShapeKind)
+
 
 def vertices_externos_px(shapes: List[Dict]) -> List[Tuple[float, float]]:
     """
@@ -18,34 +23,32 @@ def vertices_externos_px(shapes: List[Dict]) -> List[Tuple[float, float]]:
     Returns:
         List of (x, y) coordinate tuples
     """
-    verts_set = set()
-    
-    def add(x: float, y: float):
-        verts_set.add((round(x), round(y)))
+    corners: List[Tuple[float, float]] = []
         
     for shp in shapes:
-        name = shp['name']
+        kind = shp.get('kind')
+        if kind is None:
+            # Shapes built without the kind field
+            kind = shape_kind_from_name(shp['name'])
+        if kind == _OTHER:
+            continue
         x, y, w, h = shp['x'], shp['y'], shp['w'], shp['h']
         
-        if name == 'Cara1': 
-            add(x, y)
-            add(x, y + h)
-        elif name == 'Cara4': 
-            add(x + w, y)
-            add(x + w, y + h)
-        elif name.startswith('CejaSup') and w > 0: 
-            add(x, y)
-            add(x + w, y)
-        elif name.startswith('CejaInf') and w > 0: 
-            add(x, y + h)
-            add(x + w, y + h)
-        elif name.startswith('CejaLat'):
-            add(x, y)
-            add(x + w, y)
-            add(x + w, y + h)
-            add(x, y + h)
+        if kind == _CARA1: 
+            corners += ((x, y), (x, y + h))
+        elif kind == _CARA4: 
+            corners += ((x + w, y), (x + w, y + h))
+        elif kind == _CEJA_SUP:
+            if w > 0:
+                corners += ((x, y), (x + w, y))
+        elif kind == _CEJA_INF:
+            if w > 0:
+                corners += ((x, y + h), (x + w, y + h))
+        elif kind == _CEJA_LAT:
+            corners += ((x, y), (x + w, y), (x + w, y + h), (x, y + h))
             
-    return [(float(ix), float(iy)) for (ix, iy) in verts_set]
+    # Round and dedup in one pass; float keys hash like the rounded ints
+    return list({(float(round(cx)), float(round(cy))) for cx, cy in corners})
 
 
 def build_tile_orthopoly_and_edges_cm(p: PlanoParams) -> Tuple[OrthoPoly, List[Tuple[str, RectCM]]]:
@@ -63,4 +66,27 @@ def build_tile_orthopoly_and_edges_cm(p: PlanoParams) -> Tuple[OrthoPoly, List[T
     rects = rects_cm_from_params(p)
     rects_only = [r for _, r in rects]
     poly = OrthoPoly.from_rects_cm(rects_only)
-    return poly, rects
\ No newline at end of file
+    return poly, rects
+
+
+@lru_cache(maxsize=16)
+def _aligned_tile_cm(snapshot: Tuple, rot: int) -> Tuple[OrthoPoly, List[Tuple[str, RectCM]]]:
+    poly, rects = build_tile_orthopoly_and_edges_cm(PlanoParams.from_snapshot(snapshot))
+    return rotate_and_align_top_left(poly, rects, rot=rot)
+
+
+def build_aligned_tile_cm(p: PlanoParams, rot: int) -> Tuple[OrthoPoly, List[Tuple[str, RectCM]]]:
+    """
+    Build the tile rotated by rot and aligned to the origin.
+
+    Results are memoized on the geometry snapshot, so the polygon and the
+    rectangle list are shared between callers and must not be mutated.
+
+    Args:
+        p: Box parameters
+        rot: Rotation angle in degrees (multiple of 90)
+
+    Returns:
+        Tuple of (polygon, named_rectangles)
+    """
+    return _aligned_tile_cm(p.to_snapshot(), rot)
@@ -70,23 +70,22 @@ def rotate_rect_generic(r: RectCM, rot: int) -> RectCM:
         ValueError: If rotation is not multiple of 90
     """
     x, y, w, h = r
-    corners = [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
     rot = rot % 360
     
+    # Each rotated corner only takes two distinct values per axis, so the
+    # AABB comes straight from the rotated edges
     if rot == 0:
-        rc = corners
+        xa, xb, ya, yb = x, x + w, y, y + h
     elif rot == 90:
-        rc = [rotate_point_90cw(p) for p in corners]
+        xa, xb, ya, yb = y, y + h, -x, -(x + w)
     elif rot == 180:
-        rc = [rotate_point_180(p) for p in corners]
+        xa, xb, ya, yb = -x, -(x + w), -y, -(y + h)
     elif rot == 270:
-        rc = [rotate_point_270cw(p) for p in corners]
+        xa, xb, ya, yb = -y, -(y + h), x, x + w
     else:
         raise ValueError("Rotation must be multiple of 90.")
         
-    xs = [p[0] for p in rc]
-    ys = [p[1] for p in rc]
-    minx, miny, maxx, maxy = min(xs), min(ys), max(xs), max(ys)
+    minx, miny, maxx, maxy = min(xa, xb), min(ya, yb), max(xa, xb), max(ya, yb)
     return (minx, miny, maxx - minx, maxy - miny)
 
 
@@ -105,14 +104,35 @@ def rotate_and_align_top_left(poly: 'OrthoPoly', rects: List[Tuple[str, RectCM]]
     # Importación local para evitar ciclo
     from .polygons import OrthoPoly
     
-    poly_r = poly.rotated_copy(rot)
-    minx, miny, maxx, maxy = poly_r.aabb()
-    poly_r.translate(-minx, -miny)
+    # Rotate and align in a single pass: the rotated AABB follows from the
+    # original one, so no intermediate rotated copy is built
+    minx, miny, maxx, maxy = poly.aabb()
+    rot = rot % 360
+    if rot == 0:
+        def ring(pts: List[Point]) -> List[Point]:
+            return [(x - minx, y - miny) for x, y in pts]
+        rminx, rminy = minx, miny
+    elif rot == 90:
+        def ring(pts: List[Point]) -> List[Point]:
+            return [(y - miny, maxx - x) for x, y in pts]
+        rminx, rminy = miny, -maxx
+    elif rot == 180:
+        def ring(pts: List[Point]) -> List[Point]:
+            return [(maxx - x, maxy - y) for x, y in pts]
+        rminx, rminy = -maxx, -maxy
+    elif rot == 270:
+        def ring(pts: List[Point]) -> List[Point]:
+            return [(maxy - y, x - minx) for x, y in pts]
+        rminx, rminy = -maxy, minx
+    else:
+        raise ValueError("Rotation must be multiple of 90 degrees")
+
+    poly_r = OrthoPoly(ring(poly.outer), [ring(h) for h in poly.holes])
 
     new_rects: List[Tuple[str, RectCM]] = []
     for name, r in rects:
         rr = rotate_rect_generic(r, rot)
-        new_rects.append((name, (rr[0] - minx, rr[1] - miny, rr[2], rr[3])))
+        new_rects.append((name, (rr[0] - rminx, rr[1] - rminy, rr[2], rr[3])))
         
     return poly_r, new_rects
 
@@ -131,12 +151,11 @@ def calculate_polygon_area(poly: 'OrthoPoly') -> float:
     from .polygons import OrthoPoly
     
     def polygon_area(vertices: List[Point]) -> float:
-        n = len(vertices)
+        # Pair each vertex with its successor, wrapping around to the first
         area = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            area += vertices[i][0] * vertices[j][1]
-            area -= vertices[j][0] * vertices[i][1]
+        for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+            area += x1 * y2
+            area -= x2 * y1
         return abs(area) / 2.0
     
     area = polygon_area(poly.outer)
@@ -14,7 +14,7 @@ BoundingBox = Tuple[float, float, float, float]  # min_x, min_y, max_x, max_y
 # Complex type definitions
 PolygonData = Tuple[List[Point], List[List[Point]]]  # (outer, holes)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NestingResult:
     """Result of nesting algorithm calculation."""
     x: float
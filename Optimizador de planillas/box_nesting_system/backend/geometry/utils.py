@@ -2,6 +2,8 @@
 Utility functions for coordinate conversions and basic operations.
 """
 
+from typing import Iterable, List
+
 from backend.utils.constants import SCALE_INT
 from .types import Point, IPoint
 
@@ -16,7 +18,7 @@ def cm_to_i(pt: Point) -> IPoint:
     Returns:
         Point in integer coordinates (scaled by SCALE_INT)
     """
-    return (int(round(pt[0] * SCALE_INT)), int(round(pt[1] * SCALE_INT)))
+    return (round(pt[0] * SCALE_INT), round(pt[1] * SCALE_INT))
 
 
 def i_to_cm(pt: IPoint) -> Point:
@@ -29,4 +31,32 @@ def i_to_cm(pt: IPoint) -> Point:
     Returns:
         Point in centimeters
     """
-    return (pt[0] / SCALE_INT, pt[1] / SCALE_INT)
\ No newline at end of file
+    return (pt[0] / SCALE_INT, pt[1] / SCALE_INT)
+
+
+def cm_to_i_path(points: Iterable[Point]) -> List[IPoint]:
+    """
+    Convert a whole path of centimeter points to integer coordinates.
+    
+    Args:
+        points: Points in centimeters
+        
+    Returns:
+        Points in integer coordinates, rounded like cm_to_i
+    """
+    scale = SCALE_INT
+    return [(round(x * scale), round(y * scale)) for x, y in points]
+
+
+def i_to_cm_path(points: Iterable[IPoint]) -> List[Point]:
+    """
+    Convert a whole path of integer points to centimeter coordinates.
+    
+    Args:
+        points: Points in integer coordinates (pyclipper output)
+        
+    Returns:
+        Points in centimeters, identical to i_to_cm per point
+    """
+    scale = SCALE_INT
+    return [(x / scale, y / scale) for x, y in points]
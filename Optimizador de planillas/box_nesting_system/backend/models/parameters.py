@@ -4,9 +4,43 @@ Data models for box parameters and configuration.
 
 from typing import List, Tuple, Dict, Any
 from dataclasses import dataclass, field
+from enum import IntEnum
 
 
-@dataclass
+class ShapeKind(IntEnum):
+    """Shape kinds that matter for external vertex extraction."""
+    OTHER = 0
+    CARA1 = 1
+    CARA4 = 2
+    CEJA_SUP = 3
+    CEJA_INF = 4
+    CEJA_LAT = 5
+
+
+def shape_kind_from_name(name: str) -> ShapeKind:
+    """
+    Derive the shape kind from a shape name.
+    
+    Args:
+        name: Shape name as built by construir_shapes_px
+        
+    Returns:
+        Matching ShapeKind, OTHER for shapes without external vertices
+    """
+    if name == 'Cara1':
+        return ShapeKind.CARA1
+    if name == 'Cara4':
+        return ShapeKind.CARA4
+    if name.startswith('CejaSup'):
+        return ShapeKind.CEJA_SUP
+    if name.startswith('CejaInf'):
+        return ShapeKind.CEJA_INF
+    if name.startswith('CejaLat'):
+        return ShapeKind.CEJA_LAT
+    return ShapeKind.OTHER
+
+
+@dataclass(slots=True)
 class PlanoParams:
     """
     Parameters for box geometry and rendering.
@@ -31,6 +65,14 @@ class PlanoParams:
     x0: float = 100.0    # (only for Editor tab)
     y0: float = 200.0
 
+    # Bumped by touch() on in-place edits; lets holders of a cached snapshot
+    # notice that a shared params object changed
+    version: int = field(default=0, compare=False, repr=False)
+
+    def touch(self) -> None:
+        """Mark the geometry as edited in place (see version)."""
+        self.version += 1
+
     def validate(self) -> Tuple[bool, str]:
         """
         Validate parameters for consistency and physical feasibility.
@@ -91,6 +133,31 @@ class PlanoParams:
             y0=self.y0
         )
 
+    def to_snapshot(self) -> Tuple:
+        """
+        Return an immutable snapshot of the geometry parameters.
+
+        The tuple is hashable and cheap to build, so it doubles as a cache
+        key. Render-only fields (escala, x0, y0) are not included.
+
+        Returns:
+            (L, A, h, cIzq, cDer, Tapas, CSup, Bases, CInf) with the face
+            lists converted to tuples
+        """
+        return (
+            self.L, self.A, self.h, self.cIzq, self.cDer,
+            tuple(self.Tapas), tuple(self.CSup), tuple(self.Bases), tuple(self.CInf),
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Tuple) -> 'PlanoParams':
+        """Create parameters from a tuple returned by to_snapshot."""
+        L, A, h, cIzq, cDer, tapas, csup, bases, cinf = snapshot
+        return cls(
+            L=L, A=A, h=h, cIzq=cIzq, cDer=cDer,
+            Tapas=list(tapas), CSup=list(csup), Bases=list(bases), CInf=list(cinf),
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert parameters to dictionary for serialization."""
         return {
@@ -189,9 +256,12 @@ def construir_shapes_px(params: PlanoParams) -> List[Dict[str, Any]]:
     for i in range(4):
         cara_idx = i + 1
         wPanel = L if (cara_idx % 2 == 1) else A
+        cara_kind = (ShapeKind.CARA1 if cara_idx == 1 else
+                     ShapeKind.CARA4 if cara_idx == 4 else ShapeKind.OTHER)
         
         shapes.append({
             'name': f'Cara{cara_idx}',
+            'kind': cara_kind,
             'x': curX,
             'y': y0,
             'w': wPanel * s,
@@ -201,6 +271,7 @@ def construir_shapes_px(params: PlanoParams) -> List[Dict[str, Any]]:
         
         shapes.append({
             'name': f'Tapa{cara_idx}',
+            'kind': ShapeKind.OTHER,
             'x': curX,
             'y': y0 - params.Tapas[i] * s,
             'w': wPanel * s,
@@ -210,6 +281,7 @@ def construir_shapes_px(params: PlanoParams) -> List[Dict[str, Any]]:
         
         shapes.append({
             'name': f'CejaSup{cara_idx}',
+            'kind': ShapeKind.CEJA_SUP,
             'x': curX,
             'y': y0 - (params.Tapas[i] + params.CSup[i]) * s,
             'w': wPanel * s,
@@ -219,6 +291,7 @@ def construir_shapes_px(params: PlanoParams) -> List[Dict[str, Any]]:
         
         shapes.append({
             'name': f'Base{cara_idx}',
+            'kind': ShapeKind.OTHER,
             'x': curX,
             'y': y0 + h * s,
             'w': wPanel * s,
@@ -228,6 +301,7 @@ def construir_shapes_px(params: PlanoParams) -> List[Dict[str, Any]]:
         
         shapes.append({
             'name': f'CejaInf{cara_idx}',
+            'kind': ShapeKind.CEJA_INF,
             'x': curX,
             'y': y0 + (h + params.Bases[i]) * s,
             'w': wPanel * s,
@@ -239,6 +313,7 @@ def construir_shapes_px(params: PlanoParams) -> List[Dict[str, Any]]:
         
     shapes.append({
         'name': 'CejaLatIzq',
+        'kind': ShapeKind.CEJA_LAT,
         'x': x0 - params.cIzq * s,
         'y': y0,
         'w': params.cIzq * s,
@@ -248,6 +323,7 @@ def construir_shapes_px(params: PlanoParams) -> List[Dict[str, Any]]:
     
     shapes.append({
         'name': 'CejaLatDer',
+        'kind': ShapeKind.CEJA_LAT,
         'x': curX,
         'y': y0,
         'w': params.cDer * s,
@@ -3,7 +3,7 @@ Production planning and optimization models.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from enum import Enum
 
 
@@ -23,7 +23,7 @@ class LayoutStrategy(Enum):
     CUSTOM_LAYOUT = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductionParameters:
     """Parameters for production planning and optimization."""
     
@@ -154,7 +154,7 @@ class ProductionParameters:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationConstraints:
     """Constraints for layout optimization."""
     
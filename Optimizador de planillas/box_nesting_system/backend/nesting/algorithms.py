@@ -7,14 +7,36 @@ import logging
 from typing import Tuple, Optional, Dict, Any, List
 
 from backend.geometry.polygons import OrthoPoly
-from backend.geometry.render_helpers import build_tile_orthopoly_and_edges_cm  # CORREGIDO
-from backend.geometry.transformations import rotate_and_align_top_left, rotate_rect_generic
-from backend.geometry.collision import polygons_intersect
+from backend.geometry.render_helpers import build_aligned_tile_cm
+from backend.geometry.transformations import rotate_and_align_top_left
+from backend.geometry.collision import (polygons_intersect, clearance_paths_i, paths_intersect,
+                                        paths_aabb_i, aabb_may_intersect)
 from backend.geometry.types import Point, RectCM, BoundingBox, NestingResult
 from .cache import NestingCache
 from backend.utils.constants import SCALE_INT
 
 
+def _score_key(objective: str, gwidth: float, gheight: float, garea: float) -> Tuple[float, float, float]:
+    """Build the lexicographic score for a candidate global bounding box."""
+    if objective == "width":
+        return (gwidth, gheight, garea)
+    if objective == "height":
+        return (gheight, gwidth, garea)
+    return (garea, gwidth, gheight)
+
+
+def _is_better(key: Tuple[float, float, float], best_key: Tuple[float, float, float], eps: float) -> bool:
+    """Lexicographic comparison with tolerance: True if key beats best_key."""
+    if key[0] < best_key[0] - eps:
+        return True
+    if abs(key[0] - best_key[0]) <= eps:
+        if key[1] < best_key[1] - eps:
+            return True
+        if abs(key[1] - best_key[1]) <= eps:
+            return key[2] < best_key[2] - eps
+    return False
+
+
 class NestingAlgorithms:
     """
     Advanced nesting algorithms for box layout optimization.
@@ -68,13 +90,8 @@ class NestingAlgorithms:
             poly_t = OrthoPoly(base_poly.outer[:], [h[:] for h in base_poly.holes])
             rects_t = [(n, (x, y, w, h)) for (n, (x, y, w, h)) in base_rects]
         else:
-            poly_t = base_poly.rotated_copy(180)
-            minx, miny, maxx, maxy = poly_t.aabb()
-            poly_t.translate(-minx, -miny)
-            rects_t: List[Tuple[str, RectCM]] = []
-            for name, (x, y, w, h) in base_rects:
-                rr = rotate_rect_generic((x, y, w, h), 180)
-                rects_t.append((name, (rr[0] - minx, rr[1] - miny, rr[2], rr[3])))
+            # Single fused rotate + align pass
+            poly_t, rects_t = rotate_and_align_top_left(base_poly, base_rects, rot=180)
                 
         minx, miny, maxx, maxy = poly_t.aabb()
         return poly_t, rects_t, (maxx - minx), (maxy - miny)
@@ -97,74 +114,94 @@ class NestingAlgorithms:
         Returns:
             Nesting result or None if no valid placement found
         """
+        return self.best_place_second_tile_multi(
+            poly1, rects1, paso_y=paso_y, paso_x=paso_x,
+            clearance_cm=clearance_cm, objectives=(objective,)
+        )[objective]
+
+    def best_place_second_tile_multi(self, poly1: OrthoPoly, rects1: List[Tuple[str, RectCM]],
+                                     paso_y: float = 0.5, paso_x: float = 0.1,
+                                     clearance_cm: float = 0.0,
+                                     objectives: Tuple[str, ...] = ("width", "height")) -> Dict[str, Optional[NestingResult]]:
+        """
+        Find the best second-tile position for several objectives in one pass.
+        
+        Every objective sees the same candidate grid and filters as a
+        single-objective search, so the results are identical; the grid is
+        walked once and each collision test is shared between objectives.
+        
+        Args:
+            poly1: First polygon
+            rects1: First polygon rectangles
+            paso_y: Y search step
+            paso_x: X search step
+            clearance_cm: Minimum clearance
+            objectives: Optimization objectives to solve for
+            
+        Returns:
+            Mapping of objective to nesting result (None if no valid placement)
+        """
         eps = 1e-9
         minx1, miny1, maxx1, maxy1 = poly1.aabb()
         h1 = maxy1 - miny1
         max_global_height = 1.2 * h1
+        width_limit = 1.2 * (maxx1 - minx1)
 
-        best = None
-        best_key = (float("inf"), float("inf"), float("inf"))
+        best: Dict[str, Optional[NestingResult]] = {objective: None for objective in objectives}
+        best_keys = {objective: (float("inf"), float("inf"), float("inf")) for objective in objectives}
+        width_filtered = "width" in objectives
+        # The first tile never moves: convert (and offset) it once
+        paths1 = clearance_paths_i(poly1, clearance_cm)
+        aabb1_i = paths_aabb_i(paths1)
 
         for rot2 in (0, 180):
             polyT, rectsT, w2, h2 = self._make_template_for_orientation(poly1, rects1, rot2)
             (x_min, x_max), (y_min, y_max) = self._search_domain_without_bed(poly1, w2, h2)
+            tminx, tminy, tmaxx, tmaxy = polyT.aabb()
 
+            # The candidate score only depends on the translated AABB, so the
+            # expensive clipper collision test runs only for candidates that
+            # would actually improve the current best.
             y = y_min
             while y <= y_max + 1e-9:
-                x = x_min
-                while x <= x_max + 1e-9:
-                    poly2 = OrthoPoly(polyT.outer[:], [h[:] for h in polyT.holes])
-                    poly2.translate(x, y)
-
-                    if polygons_intersect(poly1, poly2, clearance_cm=clearance_cm):
-                        x += paso_x
-                        continue
-
-                    minx2, miny2, maxx2, maxy2 = poly2.aabb()
-                    
-                    if objective == "width":
-                        overlap_y = min(maxy1, maxy2) - max(miny1, miny2)
-                        if overlap_y <= eps:
-                            x += paso_x
+                miny2 = tminy + y
+                maxy2 = tmaxy + y
+                gminy = min(miny1, miny2)
+                gmaxy = max(maxy1, maxy2)
+                gheight = (gmaxy - gminy)
+                row_objectives = objectives
+                if width_filtered:
+                    overlap_y = min(maxy1, maxy2) - max(miny1, miny2)
+                    if overlap_y <= eps or gheight > max_global_height + eps:
+                        row_objectives = tuple(o for o in objectives if o != "width")
+                        if not row_objectives:
+                            y += paso_y
                             continue
 
+                x = x_min
+                while x <= x_max + 1e-9:
+                    minx2 = tminx + x
+                    maxx2 = tmaxx + x
                     gminx = min(minx1, minx2)
-                    gminy = min(miny1, miny2)
                     gmaxx = max(maxx1, maxx2)
-                    gmaxy = max(maxy1, maxy2)
                     gwidth = (gmaxx - gminx)
-                    gheight = (gmaxy - gminy)
                     garea = gwidth * gheight
 
-                    if objective == "width" and gheight > max_global_height + eps:
-                        x += paso_x
-                        continue
-                    if objective == "height":
-                        width_limit = 1.2 * (maxx1 - minx1)
-                        if gwidth < width_limit - eps:
-                            x += paso_x
+                    improving = []
+                    for objective in row_objectives:
+                        if objective == "height" and gwidth < width_limit - eps:
                             continue
-
-                    if objective == "width":
-                        key = (gwidth, gheight, garea)
-                    elif objective == "height":
-                        key = (gheight, gwidth, garea)
-                    else:
-                        key = (garea, gwidth, gheight)
-
-                    better = False
-                    if key[0] < best_key[0] - eps:
-                        better = True
-                    elif abs(key[0] - best_key[0]) <= eps:
-                        if key[1] < best_key[1] - eps:
-                            better = True
-                        elif abs(key[1] - best_key[1]) <= eps:
-                            if key[2] < best_key[2] - eps:
-                                better = True
-
-                    if better:
-                        best_key = key
-                        best = (x, y, rot2, rectsT, polyT, gwidth, gheight, garea)
+                        key = _score_key(objective, gwidth, gheight, garea)
+                        if _is_better(key, best_keys[objective], eps):
+                            improving.append((objective, key))
+
+                    if improving:
+                        # The candidate AABB is exact, so separated boxes skip clipper
+                        if (not aabb_may_intersect(aabb1_i, (minx2, miny2, maxx2, maxy2))
+                                or not paths_intersect(paths1, polyT.translated_paths_i(x, y))):
+                            for objective, key in improving:
+                                best_keys[objective] = key
+                                best[objective] = (x, y, rot2, rectsT, polyT, gwidth, gheight, garea)
                     x += paso_x
                 y += paso_y
 
@@ -209,16 +246,18 @@ class NestingAlgorithms:
 
         best = None
         best_key = (float("inf"), float("inf"), float("inf"))
+        # Fixed tiles are converted once; each candidate only builds its own paths
+        paths1 = clearance_paths_i(poly1, clearance_cm)
+        paths2 = clearance_paths_i(poly2, clearance_cm)
+        aabb1_i = paths_aabb_i(paths1)
+        aabb2_i = paths_aabb_i(paths2)
 
         # Usar parámetros proporcionados
         if params is None:
             from backend.models.parameters import PlanoParams
             params = PlanoParams()
         
-        poly_base, rects_base = build_tile_orthopoly_and_edges_cm(params)
-        poly_base_rotated, rects_base_rotated = rotate_and_align_top_left(poly_base, rects_base, rot=rot1)
-        
-        poly3T, rects3T = poly_base_rotated, rects_base_rotated
+        poly3T, rects3T = build_aligned_tile_cm(params, rot1)
         
         minx3T, miny3T, maxx3T, maxy3T = poly3T.aabb()
         w3 = maxx3T - minx3T
@@ -227,61 +266,52 @@ class NestingAlgorithms:
         (x_min, x_max), (y_min, y_max) = self._search_domain_without_bed(poly2, w3, h3)
         x_min = max(1.2 * (maxx1 - minx1), maxx2 - minx2)
         x_max = 3.0 * (maxx1 - minx1)
-        
+        width_limit = 1.2 * (maxx1 - minx1)
+
+        # Same scheme as the second tile: score from the translated AABB first
+        # and only run the collision tests for improving candidates.
         y = y_min
         while y <= y_max + 1e-9:
+            miny3 = miny3T + y
+            maxy3 = maxy3T + y
+            gminy = min(gminy12, miny3)
+            gmaxy = max(gmaxy12, maxy3)
+            gheight = gmaxy - gminy
+            if objective == "width":
+                overlap_y = min(gmaxy12, maxy3) - max(gminy12, miny3)
+                if overlap_y <= eps or gheight > max_global_height + eps:
+                    y += paso_y
+                    continue
+
             x = x_min
             while x <= x_max + 1e-9:
-                poly3 = OrthoPoly(poly3T.outer[:], [h[:] for h in poly3T.holes])
-                poly3.translate(x, y)
-
-                collision1 = polygons_intersect(poly1, poly3, clearance_cm=clearance_cm)
-                collision2 = polygons_intersect(poly2, poly3, clearance_cm=clearance_cm)
-                
-                if not collision1 and not collision2:
-                    minx3, miny3, maxx3, maxy3 = poly3.aabb()
-                    
-                    gminx = min(gminx12, minx3)
-                    gminy = min(gminy12, miny3)
-                    gmaxx = max(gmaxx12, maxx3)
-                    gmaxy = max(gmaxy12, maxy3)
-                    
-                    gwidth = gmaxx - gminx
-                    gheight = gmaxy - gminy
-                    garea = gwidth * gheight
+                minx3 = minx3T + x
+                maxx3 = maxx3T + x
+                gminx = min(gminx12, minx3)
+                gmaxx = max(gmaxx12, maxx3)
+                gwidth = gmaxx - gminx
+                garea = gwidth * gheight
 
-                    if objective == "width":
-                        overlap_y = min(gmaxy12, maxy3) - max(gminy12, miny3)
-                        if overlap_y <= eps or gheight > max_global_height + eps:
-                            x += paso_x
-                            continue
-                    if objective == "height":
-                        width_limit = 1.2 * (maxx1 - minx1)
-                        if gwidth < width_limit - eps:
-                            x += paso_x
-                            continue
+                if objective == "height" and gwidth < width_limit - eps:
+                    x += paso_x
+                    continue
 
-                    if objective == "width":
-                        key = (gwidth, gheight, garea)
-                    elif objective == "height":
-                        key = (gheight, gwidth, garea)
-                    else:
-                        key = (garea, gwidth, gheight)
+                key = _score_key(objective, gwidth, gheight, garea)
+                if not _is_better(key, best_key, eps):
+                    x += paso_x
+                    continue
 
-                    better = False
-                    if key[0] < best_key[0] - eps:
-                        better = True
-                    elif abs(key[0] - best_key[0]) <= eps:
-                        if key[1] < best_key[1] - eps:
-                            better = True
-                        elif abs(key[1] - best_key[1]) <= eps:
-                            if key[2] < best_key[2] - eps:
-                                better = True
+                aabb3 = (minx3, miny3, maxx3, maxy3)
+                near1 = aabb_may_intersect(aabb1_i, aabb3)
+                near2 = aabb_may_intersect(aabb2_i, aabb3)
+                paths3 = poly3T.translated_paths_i(x, y) if (near1 or near2) else None
+                if ((near1 and paths_intersect(paths1, paths3))
+                        or (near2 and paths_intersect(paths2, paths3))):
+                    x += paso_x
+                    continue
 
-                    if better:
-                        best_key = key
-                        best = (x, y, rects3T, poly3T, gwidth, gheight, garea)
-                
+                best_key = key
+                best = (x, y, rects3T, poly3T, gwidth, gheight, garea)
                 x += paso_x
             y += paso_y
 
@@ -335,8 +365,7 @@ def best_place_second_tile(self, poly1: OrthoPoly, rects1: List[Tuple[str, RectC
         while y <= y_max + 1e-9:
             x = x_min
             while x <= x_max + 1e-9:
-                poly2 = OrthoPoly(polyT.outer[:], [h[:] for h in polyT.holes])
-                poly2.translate(x, y)
+                poly2 = polyT.translated(x, y)
 
                 if polygons_intersect(poly1, poly2, clearance_cm=clearance_cm):
                     x += paso_x
@@ -4,11 +4,12 @@ Caching system for nesting results to improve performance.
 
 import time
 import logging
+from collections import OrderedDict
 from typing import Any, Optional, Dict, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Represents a single cache entry."""
     pattern_data: Any
@@ -34,7 +35,8 @@ class NestingCache:
         """
         self.max_size = max_size
         self.validity_period = validity_period
-        self.cache: Dict[Any, CacheEntry] = {}
+        # Ordered from least to most recently used
+        self.cache: "OrderedDict[Any, CacheEntry]" = OrderedDict()
         self.logger = logging.getLogger(__name__)
         self.hit_count = 0
         self.miss_count = 0
@@ -83,6 +85,7 @@ class NestingCache:
             return False
             
         entry.access_count += 1
+        self.cache.move_to_end(cache_key)
         self.hit_count += 1
         self.logger.debug("Cache hit for key: %s (access_count=%d)", cache_key, entry.access_count)
         return True
@@ -111,7 +114,7 @@ class NestingCache:
             cache_key: Key representing parameters
         """
         # Evict least recently used if cache is full
-        if len(self.cache) >= self.max_size:
+        if cache_key not in self.cache and len(self.cache) >= self.max_size:
             self._evict_lru()
             
         entry = CacheEntry(
@@ -120,6 +123,7 @@ class NestingCache:
             timestamp=time.time()
         )
         self.cache[cache_key] = entry
+        self.cache.move_to_end(cache_key)
         # Mantener compatibilidad con la l�gica que consulta pattern_data directamente
         self.pattern_data = pattern_data
         self.cache_key = cache_key
@@ -130,9 +134,7 @@ class NestingCache:
         if not self.cache:
             return
             
-        lru_key = min(self.cache.keys(), 
-                     key=lambda k: self.cache[k].access_count)
-        del self.cache[lru_key]
+        lru_key, _ = self.cache.popitem(last=False)
         if self.cache_key == lru_key:
             self.pattern_data = None
             self.cache_key = None
@@ -5,36 +5,64 @@ Reconstruye la funcionalidad exacta del código original.
 
 import math
 import time
+import hashlib
 import logging
 from typing import Dict, Any, Optional, Tuple, List
 
-from PySide6.QtCore import QEventLoop
+from PySide6.QtCore import QEventLoop, QThread
 from PySide6.QtWidgets import QApplication
 
-from backend.geometry.polygons import OrthoPoly
-from backend.geometry.render_helpers import build_tile_orthopoly_and_edges_cm  # CORREGIDO
-from backend.geometry.transformations import rotate_and_align_top_left, rotate_rect_generic
+from backend.geometry.render_helpers import build_aligned_tile_cm
 from backend.geometry.collision import polygons_intersect
 from backend.geometry.types import RectCM
 from backend.utils.constants import DEFAULT_CONSTANTS
 
-from .algorithms import NestingAlgorithms
+from .algorithms import NestingAlgorithms, _is_better
 from .cache import NestingCache
 from .patterns import TilingPatternGenerator
 
 
 def _pump_ui_events() -> None:
-    """Allow Qt to process pending events if the application is running."""
+    """
+    Allow Qt to process pending events if the application is running.
+
+    Only pumps on the GUI thread; searches running on a NestingWorker
+    leave the UI to its own thread and skip the pump entirely.
+    """
     app = QApplication.instance()
-    if app:
+    if app and QThread.currentThread() is app.thread():
         app.processEvents(QEventLoop.AllEvents, 5)
 
 
+def _same_ring(a: List, b: List) -> bool:
+    """True if b lists the same vertices as a, possibly from another start."""
+    if len(a) != len(b):
+        return False
+    if not a:
+        return True
+    try:
+        i = a.index(b[0])
+    except ValueError:
+        return False
+    return a[i:] + a[:i] == b
+
+
+def _same_shape(a, b) -> bool:
+    """True if two polygons have exactly the same outline and holes."""
+    return (
+        _same_ring(a.outer, b.outer)
+        and len(a.holes) == len(b.holes)
+        and all(any(_same_ring(ha, hb) for ha in a.holes) for hb in b.holes)
+    )
+
+
 class NestingEngine:
     """
     Motor principal que coordina todo el proceso de nesting.
     Replica exactamente la funcionalidad del código original de TileScene.
     """
+
+    PATTERN_STORE_SIZE = 32
     
     def __init__(self, params):
         self.params = params
@@ -46,21 +74,86 @@ class NestingEngine:
         self.nesting_cache_height = NestingCache()
         self.last_cache_key_width = None
         self.last_cache_key_height = None
+
+        # Patrones direccionados por contenido: sobreviven a clear() de los
+        # cachés por objetivo, así volver a parámetros ya vistos no recalcula.
+        self._pattern_store: Dict[bytes, Dict[str, Any]] = {}
         
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def params(self):
+        """Parámetros de la caja usados por el motor."""
+        return self._params
+
+    @params.setter
+    def params(self, params) -> None:
+        # Reasignar params o editarlos en el lugar (PlanoParams.touch, como
+        # hace PlanoTab) invalida el snapshot cacheado.
+        self._params = params
+        self._params_key: Optional[Tuple] = None
+        self._params_version = params.version
+
     def _generate_cache_key(self, paso_y, paso_x, clearance_cm, objective):
         """Genera clave única para caché (igual que original)."""
-        p = self.params
-        key_parts = [
-            p.L, p.A, p.h, p.cIzq, p.cDer,
-            tuple(p.Tapas),
-            tuple(p.CSup),
-            tuple(p.Bases), 
-            tuple(p.CInf),
-            paso_y, paso_x, clearance_cm, objective
-        ]
-        return tuple(key_parts)
+        params = self._params
+        params_key = self._params_key
+        if params_key is None or self._params_version != params.version:
+            params_key = self._params_key = params.to_snapshot()
+            self._params_version = params.version
+        return params_key + (paso_y, paso_x, clearance_cm, objective)
+
+    def _content_digest(self, paso_y, paso_x, clearance_cm, objective) -> bytes:
+        """Hash estable del snapshot de parámetros + argumentos de búsqueda."""
+        return self._key_digest(self._generate_cache_key(paso_y, paso_x, clearance_cm, objective))
+
+    @staticmethod
+    def _key_digest(cache_key) -> bytes:
+        """Hash estable de una clave de caché completa."""
+        return hashlib.blake2b(repr(cache_key).encode("utf-8"), digest_size=16).digest()
+
+    def _remember_pattern(self, digest: bytes, pattern_data: Dict[str, Any]) -> None:
+        """Guarda un patrón en el almacén por contenido (FIFO acotado)."""
+        if digest not in self._pattern_store and len(self._pattern_store) >= self.PATTERN_STORE_SIZE:
+            self._pattern_store.pop(next(iter(self._pattern_store)))
+        self._pattern_store[digest] = pattern_data
+
+    def clear_pattern_store(self) -> None:
+        """Vacía el almacén por contenido (los cachés por objetivo no se tocan)."""
+        self._pattern_store.clear()
+
+    def _restore_pattern(self, paso_y, paso_x, clearance_cm, objective) -> Optional[Dict[str, Any]]:
+        """Restaura un patrón del almacén por contenido en el caché del objetivo."""
+        stored = self._pattern_store.get(
+            self._content_digest(paso_y, paso_x, clearance_cm, objective)
+        )
+        if stored is None:
+            return None
+        cache_key = self._generate_cache_key(paso_y, paso_x, clearance_cm, objective)
+        if objective == "width":
+            self.nesting_cache_width.store(stored, cache_key)
+            self.last_cache_key_width = cache_key
+        else:
+            self.nesting_cache_height.store(stored, cache_key)
+            self.last_cache_key_height = cache_key
+        return stored
+
+    def adopt_pattern(self, objective: str, pattern_data: Dict[str, Any], cache_key) -> None:
+        """
+        Instala en este motor un patrón calculado por otro (el del worker).
+
+        La clave trae su propio snapshot de params, así que el patrón solo se
+        sirve mientras la geometría actual coincida con la del cálculo.
+        """
+        if objective == "width":
+            cache = self.nesting_cache_width
+            self.last_cache_key_width = cache_key
+        else:
+            cache = self.nesting_cache_height
+            self.last_cache_key_height = cache_key
+        if cache.pattern_data is not pattern_data or cache.cache_key != cache_key:
+            cache.store(pattern_data, cache_key)
+        self._remember_pattern(self._key_digest(cache_key), pattern_data)
 
     def _store_nesting_result(self, paso_y, paso_x, clearance_cm, objective,
                             poly1, rects1, poly2T, rects2T, poly3T, rects3T,
@@ -70,13 +163,13 @@ class NestingEngine:
             "Caching nesting result (objective=%s, paso_y=%.3f, paso_x=%.3f, clearance=%.3f)",
             objective, paso_y, paso_x, clearance_cm
         )
+        # Referencias directas, sin copiar: la búsqueda crea polígonos y rects
+        # nuevos en cada cálculo y nadie los muta después (solo translated()).
+        # No mutar los polígonos de un patrón cacheado.
         pattern_data = {
-            'poly1': OrthoPoly(poly1.outer[:], [h[:] for h in poly1.holes]),
-            'rects1': [(name, (x, y, w, h)) for name, (x, y, w, h) in rects1],
-            'poly2T': OrthoPoly(poly2T.outer[:], [h[:] for h in poly2T.holes]),
-            'rects2T': [(name, (x, y, w, h)) for name, (x, y, w, h) in rects2T],
-            'poly3T': OrthoPoly(poly3T.outer[:], [h[:] for h in poly3T.holes]),
-            'rects3T': [(name, (x, y, w, h)) for name, (x, y, w, h) in rects3T],
+            'poly1': poly1, 'rects1': rects1,
+            'poly2T': poly2T, 'rects2T': rects2T,
+            'poly3T': poly3T, 'rects3T': rects3T,
             'dx2': dx2, 'dy2': dy2,
             'dx3': dx3, 'dy3': dy3,
             'rot1': rot1, 'rot2': rot2,
@@ -85,6 +178,9 @@ class NestingEngine:
         }
         
         cache_key = self._generate_cache_key(paso_y, paso_x, clearance_cm, objective)
+        self._remember_pattern(
+            self._content_digest(paso_y, paso_x, clearance_cm, objective), pattern_data
+        )
         
         if objective == "width":
             self.nesting_cache_width.store(pattern_data, cache_key)
@@ -109,18 +205,11 @@ class NestingEngine:
             return False
             
         pattern_data = cache.pattern_data
-        required_keys = ('paso_y', 'paso_x', 'clearance_cm', 'objective')
-        if any(key not in pattern_data for key in required_keys):
-            self.logger.warning("Cache entry missing metadata (%s), forcing recalculation", objective)
-            return False
         
-        # Verificar si el caché es válido
-        current_key = self._generate_cache_key(
-            pattern_data['paso_y'],
-            pattern_data['paso_x'], 
-            pattern_data['clearance_cm'],
-            pattern_data['objective']
-        )
+        # Verificar si el caché es válido. La clave guardada (cache.cache_key)
+        # termina con los argumentos de búsqueda; el snapshot de params se toma
+        # del actual para detectar cambios de geometría.
+        current_key = self._generate_cache_key(*cache.cache_key[-4:])
         
         if not cache.is_valid(current_key):
             self.logger.debug("Cache invalid (objective=%s, key=%s)", objective, current_key)
@@ -158,80 +247,155 @@ class NestingEngine:
                 )
                 return cached_data
 
+            # Mismo contenido ya calculado: restaurar sin repetir la búsqueda
+            stored = self._restore_pattern(paso_y, paso_x, clearance_cm, objective)
+            if stored is not None:
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                self.logger.info(
+                    "calculate_optimal_nesting restaurado por contenido (objective=%s, tiles=%dx%d) en %.2f ms",
+                    objective, tiles_x, tiles_y, elapsed_ms
+                )
+                return stored
+
         # Cálculo completo (igual que original)
+        global_best = self._search_patterns(paso_y, paso_x, clearance_cm, (objective,))[objective]
+        if global_best is None:
+            return None
+
+        result = self._finalize_nesting(
+            global_best, paso_y, paso_x, clearance_cm, objective,
+            tiles_x, tiles_y, medianil_x, medianil_y
+        )
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.logger.info(
+            "calculate_optimal_nesting recalculated (objective=%s, tiles=%dx%d, force=%s) en %.2f ms",
+            objective, tiles_x, tiles_y, force_recalculate, elapsed_ms
+        )
+
+        return result
+
+    def generate_caches(self,
+                        tiles_x: int = 3,
+                        tiles_y: int = 2,
+                        paso_y: float = 0.5,
+                        paso_x: float = 0.1,
+                        clearance_cm: float = 0.0,
+                        medianil_x: float = 0.0,
+                        medianil_y: float = 0.0,
+                        objectives: Tuple[str, ...] = ("width", "height"),
+                        force_recalculate: bool = False) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Recalcula el nesting de varios objetivos en una sola pasada.
+
+        La geometría base, las rotaciones y la búsqueda del segundo tile se
+        comparten entre objetivos; cada resultado se guarda en su caché.
+        Con force_recalculate no se restauran patrones del almacén.
+
+        Returns:
+            Diccionario objetivo -> resultado (None si no hay colocación válida)
+        """
+        start_time = time.perf_counter()
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        pending = []
+        for objective in objectives:
+            # Mismo contenido ya calculado: restaurar sin repetir la búsqueda
+            stored = None if force_recalculate else self._restore_pattern(
+                paso_y, paso_x, clearance_cm, objective
+            )
+            if stored is None:
+                pending.append(objective)
+            else:
+                results[objective] = stored
+
+        if pending:
+            bests = self._search_patterns(paso_y, paso_x, clearance_cm, tuple(pending))
+            for objective in pending:
+                global_best = bests[objective]
+                results[objective] = None if global_best is None else self._finalize_nesting(
+                    global_best, paso_y, paso_x, clearance_cm, objective,
+                    tiles_x, tiles_y, medianil_x, medianil_y
+                )
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.logger.info(
+            "generate_caches (objetivos=%s, recalculados=%s) en %.2f ms",
+            ",".join(objectives), ",".join(pending) or "-", elapsed_ms
+        )
+        return results
+
+    def _search_patterns(self, paso_y: float, paso_x: float, clearance_cm: float,
+                         objectives: Tuple[str, ...]) -> Dict[str, Optional[tuple]]:
+        """Búsqueda completa de 3 tiles para cada objetivo pedido."""
         _pump_ui_events()
-        poly_base, rects_base = build_tile_orthopoly_and_edges_cm(self.params)
-        global_best = None
-        global_key = (float("inf"), float("inf"), float("inf"))
+        eps = DEFAULT_CONSTANTS.EPSILON
+        global_best: Dict[str, Optional[tuple]] = {objective: None for objective in objectives}
+        global_key = {objective: (float("inf"), float("inf"), float("inf")) for objective in objectives}
 
+        first_poly = None
         for rot1 in (90, 270):  # Probamos ambas orientaciones principales
             _pump_ui_events()
-            poly1, rects1 = rotate_and_align_top_left(poly_base, rects_base, rot=rot1)
+            poly1, rects1 = build_aligned_tile_cm(self.params, rot1)
+            # Tile simétrico a 180°: 270 repite la búsqueda de 90 con las mismas
+            # claves y nunca la mejora (la comparación es estricta)
+            if first_poly is not None and _same_shape(first_poly, poly1):
+                break
+            first_poly = poly1
             
-            # Buscar mejor posición para segundo tile
-            candidate_2tiles = self.algorithms.best_place_second_tile(
+            # Buscar mejor posición para segundo tile (una pasada para todos los objetivos)
+            candidates_2tiles = self.algorithms.best_place_second_tile_multi(
                 poly1, rects1,
                 paso_y=paso_y, paso_x=paso_x,
                 clearance_cm=clearance_cm,
-                objective=objective
+                objectives=objectives
             )
-            
-            if candidate_2tiles is None:
-                continue
 
-            best_x, best_y, rot2, rects2T, poly2T, gwidth12, gheight12, garea12 = candidate_2tiles
-            _pump_ui_events()
+            for objective in objectives:
+                candidate_2tiles = candidates_2tiles[objective]
+                if candidate_2tiles is None:
+                    continue
 
-            poly2 = OrthoPoly(poly2T.outer[:], [h[:] for h in poly2T.holes])
-            poly2.translate(best_x, best_y)
+                best_x, best_y, rot2, rects2T, poly2T, gwidth12, gheight12, garea12 = candidate_2tiles
+                _pump_ui_events()
 
-            # Buscar mejor posición para tercer tile
-            candidate_3tiles = self.algorithms.best_place_third_tile(
-                poly1, poly2, rects1, rects2T, rot1,
-                paso_y=paso_y, paso_x=paso_x, 
-                clearance_cm=clearance_cm,
-                objective=objective,
-                params=self.params
-            )
-            
-            if candidate_3tiles is None:
-                continue
+                poly2 = poly2T.translated(best_x, best_y)
 
-            x3, y3, rects3T, poly3T, gwidth, gheight, garea = candidate_3tiles
-            _pump_ui_events()
+                # Buscar mejor posición para tercer tile
+                candidate_3tiles = self.algorithms.best_place_third_tile(
+                    poly1, poly2, rects1, rects2T, rot1,
+                    paso_y=paso_y, paso_x=paso_x, 
+                    clearance_cm=clearance_cm,
+                    objective=objective,
+                    params=self.params
+                )
+                
+                if candidate_3tiles is None:
+                    continue
 
-            # Evaluar según objetivo
-            if objective == "width":
-                key = (gwidth, gheight, garea)
-            elif objective == "height":
-                key = (gheight, gwidth, garea)
-            else:
-                key = (garea, gwidth, gheight)
-
-            # Comparar con mejor solución actual
-            eps = DEFAULT_CONSTANTS.EPSILON
-
-            better = False
-            if key[0] < global_key[0] - eps:
-                better = True
-            elif abs(key[0] - global_key[0]) <= eps:
-                if key[1] < global_key[1] - eps:
-                    better = True
-                elif abs(key[1] - global_key[1]) <= eps:
-                    if key[2] < global_key[2] - eps:
-                        better = True
-
-            if better:
-                _pump_ui_events()
-                global_key = key
-                global_best = (rot1, poly1, rects1, 
-                              best_x, best_y, rot2, rects2T, poly2T,
-                              x3, y3, rects3T, poly3T, 
-                              gwidth, gheight, garea)
+                x3, y3, rects3T, poly3T, gwidth, gheight, garea = candidate_3tiles
 
-        if global_best is None:
-            return None
+                # Evaluar según objetivo
+                if objective == "width":
+                    key = (gwidth, gheight, garea)
+                elif objective == "height":
+                    key = (gheight, gwidth, garea)
+                else:
+                    key = (garea, gwidth, gheight)
+
+                # Comparar con mejor solución actual
+                if _is_better(key, global_key[objective], eps):
+                    global_key[objective] = key
+                    global_best[objective] = (rot1, poly1, rects1, 
+                                              best_x, best_y, rot2, rects2T, poly2T,
+                                              x3, y3, rects3T, poly3T, 
+                                              gwidth, gheight, garea)
+
+        return global_best
 
+    def _finalize_nesting(self, global_best: tuple, paso_y: float, paso_x: float,
+                          clearance_cm: float, objective: str, tiles_x: int, tiles_y: int,
+                          medianil_x: float, medianil_y: float) -> Dict[str, Any]:
+        """Guarda el mejor patrón en caché y arma el resultado público."""
         # Extraer resultados
         (rot1, poly1, rects1, 
          best_x, best_y, rot2, rects2T, poly2T,
@@ -246,12 +410,6 @@ class NestingEngine:
             best_x, best_y, x3, y3, rot1, rot2
         )
 
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
-        self.logger.info(
-            "calculate_optimal_nesting recalculated (objective=%s, tiles=%dx%d, force=%s) en %.2f ms",
-            objective, tiles_x, tiles_y, force_recalculate, elapsed_ms
-        )
-
         return {
             'poly1': poly1, 'rects1': rects1,
             'poly2T': poly2T, 'rects2T': rects2T,
@@ -296,8 +454,7 @@ class NestingEngine:
             
         if not cache.pattern_data:
             # Fallback a un tile simple
-            poly_base, _ = build_tile_orthopoly_and_edges_cm(self.params)
-            poly1, _ = rotate_and_align_top_left(poly_base, [], rot=90)
+            poly1, _ = build_aligned_tile_cm(self.params, 90)
             minx, miny, maxx, maxy = poly1.aabb()
             return (minx, miny, maxx, maxy)
         
@@ -310,11 +467,34 @@ class NestingEngine:
         dx3 = pattern_data['dx3']
         dy3 = pattern_data['dy3']
         
-        minx1, miny1, maxx1, maxy1 = poly1.aabb()
+        aabb1 = poly1.aabb()
+        aabb2 = poly2T.aabb()
+        aabb3 = poly3T.aabb()
+        minx1, miny1, maxx1, maxy1 = aabb1
         h1 = maxy1 - miny1
         
         # Calcular desplazamiento vertical INCLUYENDO MEDIANIL_Y
         vertical_offset = h1 + medianil_y
+
+        # Datos por columna (igual que original), calculados una sola vez:
+        # (aabb, offset_x, offset_y sin la fila; None = solo la fila)
+        col_data = []
+        for col in range(tiles_x):
+            if col == 0:
+                col_data.append((aabb1, 0.0, None))
+            elif col == 1:
+                col_data.append((aabb2, dx2 + medianil_x, dy2))
+            elif col == 2:
+                col_data.append((aabb3, dx3 + (2 * medianil_x), dy3))
+            elif col % 2 == 1:  # Tile par
+                prev_tile_x = dx3 * ((col-1) // 2) + ((col-1) * medianil_x)
+                prev_tile_y = dy3 * ((col-1) // 2)
+                col_data.append((aabb2, prev_tile_x + dx2 + medianil_x, prev_tile_y + dy2))
+            else:  # Tile impar
+                prev_tile_x = dx2 + dx3 * ((col-2) // 2) + ((col-1) * medianil_x)
+                prev_tile_y = dy2 + dy3 * ((col-2) // 2)
+                col_data.append((aabb3, prev_tile_x + (dx3 - dx2) + medianil_x,
+                                 prev_tile_y + (dy3 - dy2)))
         
         # Inicializar bounding box global
         global_minx = float('inf')
@@ -322,39 +502,17 @@ class NestingEngine:
         global_maxx = float('-inf')
         global_maxy = float('-inf')
         
-        # Generar todas las filas (igual que original)
-        for row in range(tiles_y):
+        # Las filas solo desplazan en Y y row * vertical_offset es monótono en
+        # row, así que los extremos globales salen de la primera y la última
+        # fila: O(tiles_x) en lugar de O(tiles_x * tiles_y), mismo resultado.
+        rows = (0, tiles_y - 1) if tiles_y > 1 else range(tiles_y)
+        for row in rows:
             row_offset_y = row * vertical_offset
             
-            for col in range(tiles_x):
-                if col == 0:
-                    current_poly = poly1
-                    offset_x = 0.0
-                    offset_y = row_offset_y
-                elif col == 1:
-                    current_poly = poly2T
-                    offset_x = dx2 + medianil_x
-                    offset_y = dy2 + row_offset_y
-                elif col == 2:
-                    current_poly = poly3T
-                    offset_x = dx3 + (2 * medianil_x)
-                    offset_y = dy3 + row_offset_y
-                else:
-                    if col % 2 == 1:  # Tile par
-                        prev_tile_x = dx3 * ((col-1) // 2) + ((col-1) * medianil_x)
-                        prev_tile_y = dy3 * ((col-1) // 2)
-                        offset_x = prev_tile_x + dx2 + medianil_x
-                        offset_y = prev_tile_y + dy2 + row_offset_y
-                        current_poly = poly2T
-                    else:  # Tile impar
-                        prev_tile_x = dx2 + dx3 * ((col-2) // 2) + ((col-1) * medianil_x)
-                        prev_tile_y = dy2 + dy3 * ((col-2) // 2)
-                        offset_x = prev_tile_x + (dx3 - dx2) + medianil_x
-                        offset_y = prev_tile_y + (dy3 - dy2) + row_offset_y
-                        current_poly = poly3T
+            for (minx, miny, maxx, maxy), offset_x, offset_y in col_data:
+                offset_y = row_offset_y if offset_y is None else offset_y + row_offset_y
                 
-                # Calcular bounding box del tile actual
-                minx, miny, maxx, maxy = current_poly.aabb()
+                # Bounding box del tile actual
                 minx += offset_x
                 miny += offset_y
                 maxx += offset_x
@@ -112,49 +112,33 @@ class LayoutOptimizer:
             Tuple of (min_x, min_y, max_x, max_y) or None
         """
         try:
-            # Find minimum tiles_x that fits in X direction
-            tiles_x_min = 1
-            while True:
-                bbox = scene.calculate_global_bbox(tiles_x_min, 1, medianil_x, medianil_y, objective)
-                ancho_total = bbox[2] - bbox[0]
-                if ancho_total >= x_min_roland:
-                    break
-                tiles_x_min += 1
-                if tiles_x_min > 100:  # Safety limit
-                    return None
+            def ancho_total(tiles_x: int, tiles_y: int) -> float:
+                bbox = scene.calculate_global_bbox(tiles_x, tiles_y, medianil_x, medianil_y, objective)
+                return bbox[2] - bbox[0]
+
+            def alto_total(tiles_x: int, tiles_y: int) -> float:
+                bbox = scene.calculate_global_bbox(tiles_x, tiles_y, medianil_x, medianil_y, objective)
+                return bbox[3] - bbox[1]
+
+            # Find minimum tiles_x that fits in X direction (safety limit 100)
+            tiles_x_min = self._first_tiles_count(lambda n: ancho_total(n, 1) >= x_min_roland, 1, 100)
+            if tiles_x_min > 100:
+                return None
 
             # Find minimum tiles_y that fits in Y direction
-            tiles_y_min = 1
-            while True:
-                bbox = scene.calculate_global_bbox(tiles_x_min, tiles_y_min, medianil_x, medianil_y, objective)
-                alto_total = bbox[3] - bbox[1]
-                if alto_total >= y_min_roland:
-                    break
-                tiles_y_min += 1
-                if tiles_y_min > 100:  # Safety limit
-                    return None
+            tiles_y_min = self._first_tiles_count(lambda n: alto_total(tiles_x_min, n) >= y_min_roland, 1, 100)
+            if tiles_y_min > 100:
+                return None
 
-            # Find maximum tiles_x that fits in X direction
-            tiles_x_max = tiles_x_min
-            while True:
-                bbox = scene.calculate_global_bbox(tiles_x_max + 1, 1, medianil_x, medianil_y, objective)
-                ancho_total = bbox[2] - bbox[0]
-                if ancho_total > x_max_roland:
-                    break
-                tiles_x_max += 1
-                if tiles_x_max > 100:  # Safety limit
-                    break
+            # Find maximum tiles_x that fits in X direction (capped at 101)
+            tiles_x_max = self._first_tiles_count(
+                lambda n: ancho_total(n, 1) > x_max_roland, tiles_x_min + 1, 101
+            ) - 1
 
             # Find maximum tiles_y that fits in Y direction
-            tiles_y_max = tiles_y_min
-            while True:
-                bbox = scene.calculate_global_bbox(tiles_x_max, tiles_y_max + 1, medianil_x, medianil_y, objective)
-                alto_total = bbox[3] - bbox[1]
-                if alto_total > y_max_roland:
-                    break
-                tiles_y_max += 1
-                if tiles_y_max > 100:  # Safety limit
-                    break
+            tiles_y_max = self._first_tiles_count(
+                lambda n: alto_total(tiles_x_max, n) > y_max_roland, tiles_y_min + 1, 101
+            ) - 1
 
             return (tiles_x_min, tiles_y_min, tiles_x_max, tiles_y_max)
             
@@ -162,6 +146,31 @@ class LayoutOptimizer:
             self.logger.error("Error calculating layout bounds: %s", e)
             return None
 
+    @staticmethod
+    def _first_tiles_count(predicate, low: int, high: int) -> int:
+        """
+        Return the smallest count in [low, high] for which ``predicate`` holds, or high + 1.
+        
+        The global bounding box only grows when tiles are added, so the size
+        predicates are monotonic and a bisection finds the same count as a
+        linear scan with O(log n) bounding box evaluations.
+        
+        Args:
+            predicate: Monotonic test on a tile count
+            low: First count to consider
+            high: Last count to consider
+            
+        Returns:
+            First count satisfying the predicate, or high + 1 if none does
+        """
+        while low <= high:
+            mid = (low + high) // 2
+            if predicate(mid):
+                high = mid - 1
+            else:
+                low = mid + 1
+        return low
+
     def _calculate_production_metrics(self,
                                     tiles_x_min: int, tiles_y_min: int,
                                     tiles_x_max: int, tiles_y_max: int,
@@ -280,14 +289,18 @@ class LayoutOptimizer:
         """
         factores_posibles = []
         
+        # Only divisor pairs of the required count can match, one ty per tx
         for tx in range(tiles_x_min, tiles_x_max + 1):
-            for ty in range(tiles_y_min, tiles_y_max + 1):
-                if tx * ty == total_tiles_necesario:
-                    bbox = scene.calculate_global_bbox(tx, ty, medianil_x, medianil_y, objective)
-                    ancho = bbox[2] - bbox[0]
-                    alto = bbox[3] - bbox[1]
-                    area = ancho * alto
-                    factores_posibles.append((tx, ty, area, ancho, alto))
+            if total_tiles_necesario % tx:
+                continue
+            ty = total_tiles_necesario // tx
+            if not tiles_y_min <= ty <= tiles_y_max:
+                continue
+            bbox = scene.calculate_global_bbox(tx, ty, medianil_x, medianil_y, objective)
+            ancho = bbox[2] - bbox[0]
+            alto = bbox[3] - bbox[1]
+            area = ancho * alto
+            factores_posibles.append((tx, ty, area, ancho, alto))
         
         if factores_posibles:
             # Find layout with minimum area
@@ -65,8 +65,7 @@ class MainWindow(QMainWindow):
 
     def _connect_signals(self) -> None:
         """Connect signal handlers."""
-        # Connect plano tab signals if needed
-        pass
+        self.plano_tab.open_tile_requested.connect(self.abrir_tile_tab)
 
     def abrir_tile_tab(self) -> None:
         """
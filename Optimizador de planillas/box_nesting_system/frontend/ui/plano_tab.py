@@ -3,10 +3,12 @@ Plano (Editor) tab implementation for box parameter editing and visualization.
 """
 
 import logging
+from array import array
+from functools import partial
 from typing import List, Dict, Any
 import unicodedata
 
-from PySide6.QtCore import Qt, QPointF
+from PySide6.QtCore import Qt, QPointF, QTimer, Signal
 from PySide6.QtGui import QColor, QFont, QPen
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QFormLayout, QDoubleSpinBox,
@@ -15,7 +17,7 @@ from PySide6.QtWidgets import (
 
 from backend.models.parameters import PlanoParams, construir_shapes_px
 from backend.models.templates import get_template
-from .widgets import ZoomGraphicsView, PlanoScene
+from .widgets import ZoomGraphicsView, PlanoScene, tiled_background_brush
 
 
 class PlanoTab(QWidget):
@@ -30,9 +32,23 @@ class PlanoTab(QWidget):
         view (ZoomGraphicsView): View for scene navigation
     """
     
+    open_tile_requested = Signal()
+
     RENDER_ESCALA = 10.0
     RENDER_X0 = 100.0
     RENDER_Y0 = 200.0
+    REDRAW_DELAY_MS = 80
+    PICTURE_CACHE_SIZE = 16
+    TEMPLATE_NAMES = ("Personalizado", "Fondo automático", "Avion", "Francesa")
+
+    # (PlanoParams attribute, spinbox attribute) pairs; order defines the
+    # flat value layout shared by sync_params and _update_ui_from_params
+    _SCALAR_MAP = (
+        ("L", "sb_L"), ("A", "sb_A"), ("h", "sb_h"), ("cIzq", "sb_cIzq"), ("cDer", "sb_cDer"),
+    )
+    _FACE_MAP = (
+        ("Tapas", "sb_Tapas"), ("CSup", "sb_CSup"), ("Bases", "sb_Bases"), ("CInf", "sb_CInf"),
+    )
 
     def __init__(self, params: PlanoParams):
         """
@@ -48,8 +64,20 @@ class PlanoTab(QWidget):
         self.params.x0 = self.RENDER_X0
         self.params.y0 = self.RENDER_Y0
         self._template_name = "Personalizado"
-        self._template_definitions = self._build_templates()
+        self._template_lookup = self._build_templates()
+        self._custom_names = {"Personalizado"}
         self._applying_template = False
+        # Set while _update_ui_from_params pushes params into the editors
+        self._loading_params = False
+        self._last_sig: tuple | None = None
+        self._last_bbox = None
+        self._picture_cache: Dict[tuple, Any] = {}
+
+        # Coalesce bursts of spinbox edits into a single redraw
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(self.REDRAW_DELAY_MS)
+        self._redraw_timer.timeout.connect(self._do_redraw)
         
         self._setup_ui()
         self._connect_signals()
@@ -67,11 +95,19 @@ class PlanoTab(QWidget):
         # Create control panel
         control_panel = self._build_control_panel()
         layout.addWidget(control_panel, 0)
+
+        # Fixed order used to push parameter values back into the editors
+        self._all_face_spins = self._face_spins + [
+            getattr(self, widget) for _, widget in self._SCALAR_MAP
+        ]
+        # Editor values in the same order, kept current by valueChanged so
+        # sync_params never has to query the spinboxes
+        self._values = array('d', (spinbox.value() for spinbox in self._all_face_spins))
         
         # Create graphics view
         self.scene = PlanoScene()
         self.view = ZoomGraphicsView(self.scene)
-        self.view.setBackgroundBrush(QColor(245, 245, 245))
+        self.view.setBackgroundBrush(tiled_background_brush(QColor(245, 245, 245)))
         layout.addWidget(self.view, 1)
 
     def _build_control_panel(self) -> QWidget:
@@ -88,7 +124,7 @@ class PlanoTab(QWidget):
         # Template selector
         template_label = QLabel("Plantilla de caja:")
         self.cb_template = QComboBox()
-        self.cb_template.addItems(["Personalizado", "Fondo automático", "Avion", "Francesa"])
+        self.cb_template.addItems(list(self.TEMPLATE_NAMES))
         self.cb_template.currentTextChanged.connect(self._on_template_changed)
         layout.addWidget(template_label)
         layout.addWidget(self.cb_template)
@@ -137,6 +173,11 @@ class PlanoTab(QWidget):
                 spin = self._create_spinbox(values[cara], 0.0, 100.0, 0.1)
                 target_list.append(spin)
                 face_grid.addWidget(spin, row_index, cara + 1)
+
+        # Flat view of the 16 face editors: Tapas, CSup, Bases, CInf (4 each)
+        self._face_spins = [
+            spin for _, widget in self._FACE_MAP for spin in getattr(self, widget)
+        ]
         
         # Action buttons
         btn_redibujar = QPushButton("Redibujar")
@@ -182,27 +223,30 @@ class PlanoTab(QWidget):
     def _connect_signals(self) -> None:
         """Connect signal handlers for automatic updates."""
         # Connect value change signals for real-time updates
-        spinboxes = [
-            self.sb_L, self.sb_A, self.sb_h, self.sb_cIzq, self.sb_cDer
-        ]
-        
-        for spinbox in spinboxes:
-            spinbox.valueChanged.connect(self._on_parameter_changed)
-        
-        # Connect face parameter spinboxes
-        for i in range(4):
-            self.sb_Tapas[i].valueChanged.connect(self._on_parameter_changed)
-            self.sb_CSup[i].valueChanged.connect(self._on_parameter_changed)
-            self.sb_Bases[i].valueChanged.connect(self._on_parameter_changed)
-            self.sb_CInf[i].valueChanged.connect(self._on_parameter_changed)
+        for index, spinbox in enumerate(self._all_face_spins):
+            spinbox.valueChanged.connect(partial(self._store_value, index))
+
+    def _store_value(self, index: int, value: float) -> None:
+        """Record an edited value in the value buffer and schedule a redraw."""
+        self._values[index] = value
+        if not self._loading_params:
+            self._on_parameter_changed()
 
     def _on_parameter_changed(self) -> None:
         """
         Handle parameter changes with automatic update.
         
-        This provides real-time feedback as users adjust parameters.
+        The redraw is debounced so rapid edits only trigger one render
+        once the user pauses.
         """
+        self._redraw_timer.start()
+
+    def _do_redraw(self) -> None:
+        """Sync parameters and redraw after the debounce interval."""
         self.sync_params()
+        if self._params_signature() == self._last_sig:
+            self.logger.debug("Parameters unchanged, skipping redraw")
+            return
         if not self._is_custom_template():
             self._apply_template(self._template_name)
             return
@@ -210,31 +254,57 @@ class PlanoTab(QWidget):
 
     def sync_params(self) -> None:
         """Synchronize UI values with parameters object."""
-        self.params.L = self.sb_L.value()
-        self.params.A = self.sb_A.value()
-        self.params.h = self.sb_h.value()
-        self.params.cIzq = self.sb_cIzq.value()
-        self.params.cDer = self.sb_cDer.value()
+        params = self.params
+        values = self._values
+        changed = False
+        for index, (attr, _) in enumerate(self._FACE_MAP):
+            face = values[4 * index:4 * index + 4].tolist()
+            current = getattr(params, attr)
+            if current != face:
+                current[:] = face
+                changed = True
         
-        for i in range(4):
-            self.params.Tapas[i] = self.sb_Tapas[i].value()
-            self.params.CSup[i] = self.sb_CSup[i].value()
-            self.params.Bases[i] = self.sb_Bases[i].value()
-            self.params.CInf[i] = self.sb_CInf[i].value()
+        offset = 4 * len(self._FACE_MAP)
+        scalars = [(attr, values[offset + index]) for index, (attr, _) in enumerate(self._SCALAR_MAP)]
+        scalars += [("escala", self.RENDER_ESCALA), ("x0", self.RENDER_X0), ("y0", self.RENDER_Y0)]
+        for attr, value in scalars:
+            if getattr(params, attr) != value:
+                setattr(params, attr, value)
+                changed = True
         
-        self.params.escala = self.RENDER_ESCALA
-        self.params.x0 = self.RENDER_X0
-        self.params.y0 = self.RENDER_Y0
+        # The object is shared with TileTab and its engines; only a real
+        # edit bumps the version they compare against
+        if changed:
+            params.touch()
         
-        self.logger.debug("Parameters synchronized")
+        self.logger.debug("Parameters synchronized (changed=%s)", changed)
+
+    def _params_signature(self) -> tuple:
+        """Return a cheap hashable snapshot of the drawn parameters."""
+        return self.params.to_snapshot()
 
     def redibujar(self) -> None:
         """Redraw the plano with current parameters."""
         try:
-            self.scene.render_plano(self.params)
-            bbox = self.scene.bounding_box_px(self.params)
-            self.view.resetTransform()
-            self.view.fitInView(bbox, Qt.KeepAspectRatio)
+            sig = self._params_signature()
+            cached = self._picture_cache.get(sig)
+            if cached is not None:
+                picture, rect, bbox = cached
+                self.scene.show_picture(picture, rect)
+            else:
+                bbox = self.scene.render_plano(self.params)
+                if len(self._picture_cache) >= self.PICTURE_CACHE_SIZE:
+                    self._picture_cache.pop(next(iter(self._picture_cache)))
+                picture, rect = self.scene.record_picture()
+                self._picture_cache[sig] = (picture, rect, bbox)
+                # Paint the recorded picture from now on instead of the
+                # live items, so recording is not an extra render
+                self.scene.show_picture(picture, rect)
+            self._last_sig = sig
+            if bbox != self._last_bbox:
+                self.view.resetTransform()
+                self.view.fitInView(bbox, Qt.KeepAspectRatio)
+                self._last_bbox = bbox
             
             self.logger.debug("Plano redrawn successfully")
             
@@ -245,24 +315,12 @@ class PlanoTab(QWidget):
         """Reset view to default position and scale."""
         self.view.resetTransform()
         self.view.centerOn(QPointF(self.params.x0, self.params.y0))
+        self._last_bbox = None
         self.logger.debug("View reset to default")
 
     def abrir_tile_tab(self) -> None:
-        """Request to open the Tile tab from parent window."""
-        try:
-            # Ensure parameters are synced
-            self.sync_params()
-            
-            # Emit signal or call parent method
-            if hasattr(self.parent(), 'abrir_tile_tab'):
-                self.parent().abrir_tile_tab()
-            elif hasattr(self.window(), 'abrir_tile_tab'):
-                self.window().abrir_tile_tab()
-            else:
-                self.logger.warning("Could not find method to open tile tab")
-                
-        except Exception as e:
-            self.logger.error("Error opening tile tab: %s", e, exc_info=True)
+        """Request the owning window to open the Tile tab."""
+        self.open_tile_requested.emit()
 
     def get_current_params(self) -> PlanoParams:
         """
@@ -291,41 +349,18 @@ class PlanoTab(QWidget):
 
     def _update_ui_from_params(self) -> None:
         """Update UI elements from current parameters."""
-        # Block signals to prevent recursive updates
-        self.sb_L.blockSignals(True)
-        self.sb_A.blockSignals(True)
-        self.sb_h.blockSignals(True)
-        self.sb_cIzq.blockSignals(True)
-        self.sb_cDer.blockSignals(True)
-        
-        self.sb_L.setValue(self.params.L)
-        self.sb_A.setValue(self.params.A)
-        self.sb_h.setValue(self.params.h)
-        self.sb_cIzq.setValue(self.params.cIzq)
-        self.sb_cDer.setValue(self.params.cDer)
-        
-        for i in range(4):
-            self.sb_Tapas[i].blockSignals(True)
-            self.sb_CSup[i].blockSignals(True)
-            self.sb_Bases[i].blockSignals(True)
-            self.sb_CInf[i].blockSignals(True)
-            
-            self.sb_Tapas[i].setValue(self.params.Tapas[i])
-            self.sb_CSup[i].setValue(self.params.CSup[i])
-            self.sb_Bases[i].setValue(self.params.Bases[i])
-            self.sb_CInf[i].setValue(self.params.CInf[i])
-            
-            self.sb_Tapas[i].blockSignals(False)
-            self.sb_CSup[i].blockSignals(False)
-            self.sb_Bases[i].blockSignals(False)
-            self.sb_CInf[i].blockSignals(False)
-        
-        # Restore signals
-        self.sb_L.blockSignals(False)
-        self.sb_A.blockSignals(False)
-        self.sb_h.blockSignals(False)
-        self.sb_cIzq.blockSignals(False)
-        self.sb_cDer.blockSignals(False)
+        p = self.params
+        values = [value for attr, _ in self._FACE_MAP for value in getattr(p, attr)]
+        values += [getattr(p, attr) for attr, _ in self._SCALAR_MAP]
+
+        # One guard for the whole batch: _store_value keeps the value buffer
+        # in step but schedules no redraw while it is set
+        self._loading_params = True
+        try:
+            for spinbox, value in zip(self._all_face_spins, values):
+                spinbox.setValue(value)
+        finally:
+            self._loading_params = False
 
     def validate_parameters(self) -> bool:
         """
@@ -386,8 +421,7 @@ class PlanoTab(QWidget):
             self.redibujar()
 
     def _apply_template(self, template_name: str) -> None:
-        key = self._normalize_template_name(template_name)
-        definition = self._template_definitions.get(key)
+        definition = self._template_lookup.get(template_name)
         if not definition or self._applying_template:
             return
         self._applying_template = True
@@ -399,6 +433,7 @@ class PlanoTab(QWidget):
             self.params.CInf = values.get("CejaInf", self.params.CInf)
             if "cDer" in values:
                 self.params.cDer = values["cDer"]
+            self.params.touch()
             self._update_ui_from_params()
             self.redibujar()
         finally:
@@ -406,16 +441,16 @@ class PlanoTab(QWidget):
 
     def _set_face_group_enabled(self, enabled: bool) -> None:
         self.face_group.setVisible(enabled)
-        for spin_list in (self.sb_Tapas, self.sb_CSup, self.sb_Bases, self.sb_CInf):
-            for spin in spin_list:
-                spin.setEnabled(enabled)
+        for spin in self._face_spins:
+            spin.setEnabled(enabled)
 
     def _is_custom_template(self) -> bool:
-        return self._normalize_template_name(self._template_name) == "personalizado"
+        return self._template_name in self._custom_names
 
     def _normalize_template_name(self, name: str) -> str:
         normalized = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
         return normalized.strip().lower()
 
     def _build_templates(self) -> Dict[str, Any]:
-        return {key: get_template(key.lower()).builder for key in ["personalizado", "fondo automatico", "avion", "francesa"]}
+        # Normalize once here; lookups afterwards use the exact combobox text
+        return {name: get_template(self._normalize_template_name(name)).builder for name in self.TEMPLATE_NAMES}
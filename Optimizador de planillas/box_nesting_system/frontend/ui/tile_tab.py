@@ -6,8 +6,11 @@ Tile (Cama Roland) tab implementation for nesting optimization and visualization
 
 
 
+import hashlib
 import math
 import time
+from collections import namedtuple
+from functools import lru_cache
 
 import logging
 
@@ -15,7 +18,7 @@ from typing import Tuple, Optional, Dict, Any
 
 
 
-from PySide6.QtCore import Qt, QRectF, QEventLoop, QThread, Signal
+from PySide6.QtCore import Qt, QRectF, QEventLoop, QObject, QRunnable, QThreadPool, QTimer, Signal
 
 from PySide6.QtGui import QColor, QTransform
 
@@ -34,20 +37,40 @@ from backend.models.parameters import PlanoParams
 from backend.nesting.engine import NestingEngine
 
 
-class NestingWorker(QThread):
+# Positional arguments of NestingEngine.calculate_optimal_nesting, in order
+EngineArgs = namedtuple(
+    'EngineArgs',
+    'tiles_x tiles_y paso_y paso_x clearance_cm medianil_x medianil_y objective force_recalculate',
+    defaults=(1, 1, 0.0, 0.0, 0.0, 0.0, 0.0, "width", False),
+)
+
+
+class NestingWorkerSignals(QObject):
     result_ready = Signal(dict)
     error = Signal(str)
+    finished = Signal()
+
+
+class NestingWorker(QRunnable):
+    """
+    Runs one nesting calculation from the thread pool.
+
+    Each run gets its own engine on a copy of the params, so the GUI thread
+    never shares state with the running calculation; results are merged back
+    in _on_nesting_worker_success.
+    """
 
-    def __init__(self, params: PlanoParams, engine_args: Dict[str, Any]):
+    def __init__(self, engine: NestingEngine, engine_args: EngineArgs):
         super().__init__()
-        self.params = params.copy()
+        self.engine = engine
         self.engine_args = engine_args
+        self.signals = NestingWorkerSignals()
 
     def run(self) -> None:
         try:
-            engine = NestingEngine(self.params)
-            result = engine.calculate_optimal_nesting(**self.engine_args)
-            objective = self.engine_args.get("objective", "width")
+            engine = self.engine
+            result = engine.calculate_optimal_nesting(*self.engine_args)
+            objective = self.engine_args.objective
             cache = (
                 engine.nesting_cache_width
                 if objective == "width" else engine.nesting_cache_height
@@ -57,11 +80,82 @@ class NestingWorker(QThread):
                 "cache_entry": cache.pattern_data,
                 "cache_key": cache.cache_key,
             }
-            self.result_ready.emit(payload)
+            self.signals.result_ready.emit(payload)
         except Exception as exc:
-            self.error.emit(str(exc))
+            self.signals.error.emit(str(exc))
+        finally:
+            self.signals.finished.emit()
 
-from .widgets import ZoomGraphicsView, TileScene
+from .widgets import ZoomGraphicsView, TileScene, tiled_background_brush
+
+
+# Offsets/rotations assumed when a cached pattern lacks them
+_PATTERN_DEFAULTS = {'dx2': 0.0, 'dy2': 0.0, 'dx3': 0.0, 'dy3': 0.0, 'rot1': 0, 'rot2': 0}
+
+
+class _CurrentState:
+    """Parameters of the layout last drawn in the tile scene."""
+
+    __slots__ = ('medianil_x', 'medianil_y', 'tiles_x', 'tiles_y', 'paso_y', 'paso_x', 'clearance', 'objective')
+
+    def __init__(self):
+        self.medianil_x = 0.0
+        self.medianil_y = 0.0
+        self.tiles_x = 1
+        self.tiles_y = 1
+        self.paso_y = 0.5
+        self.paso_x = 0.1
+        self.clearance = 0.0
+        self.objective = "width"
+
+
+def _geometry_key(params: PlanoParams) -> int:
+    """Return a 64-bit digest of the box geometry, used as the signature prefix."""
+    digest = hashlib.blake2b(repr(params.to_snapshot()).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+# HTML skeletons of the result dialogs, filled with str.format
+_ROW_HTML = (
+    "<tr><td style='padding:2px 12px 2px 0;color:#5a5a5a;'>{}</td>"
+    "<td style='padding:2px 0;font-weight:600;color:#1f1f1f;'>{}</td></tr>"
+)
+_SECTION_HTML = (
+    "<div style='margin-bottom:14px;'>"
+    "<div style='font-size:11pt;font-weight:600;margin-bottom:4px;'>{}</div>"
+    "<table style='border-collapse:collapse;font-size:10pt;'>{}</table>"
+    "</div>"
+)
+_ALERT_LINE_HTML = "<div style='margin-bottom:6px;color:#2b2b2b;'>{}</div>"
+_MESSAGE_HTML = (
+    "<html>"
+    "<body style=\"font-family:'Segoe UI',sans-serif;font-size:10pt;line-height:1.35;\">"
+    "{}"
+    "</body>"
+    "</html>"
+)
+
+
+def _format_section_html(title: str, rows: list[tuple[str, str]]) -> str:
+    """Render a compact HTML section with a title and a key/value table."""
+    row_html = _ROW_HTML.format
+    table_rows = "".join(row_html(label, value) for label, value in rows)
+    return _SECTION_HTML.format(title, table_rows)
+
+
+@lru_cache(maxsize=64)
+def _layout_section_html(tipo_encastre: str, tiles_x: int, tiles_y: int, planilla: int,
+                         ancho: float, alto: float, area: float) -> str:
+    """HTML block describing one layout result; repeated results reuse the cached markup."""
+    return _format_section_html(f"Resultado para {tipo_encastre}", [
+        ("Tipo de encastre:", tipo_encastre),
+        ("Cantidad de tiles en X:", tiles_x),
+        ("Cantidad de tiles en Y:", tiles_y),
+        ("Planilla:", planilla),
+        ("Medida en X de la planilla:", f"{ancho:.2f} cm"),
+        ("Medida en Y de la planilla:", f"{alto:.2f} cm"),
+        ("Área de la planilla:", f"{area:.2f} cm<sup>2</sup>"),
+    ])
 
 
 
@@ -75,6 +169,8 @@ class TileTab(QWidget):
 
     """
 
+    BBOX_MEMO_SIZE = 4096
+
 
 
     def __init__(self, params: PlanoParams):
@@ -83,34 +179,21 @@ class TileTab(QWidget):
 
         self.logger = logging.getLogger(__name__)
         self.params = params
+        # Geometry part of the cache signature, see _geometry_sig_prefix
+        self._params_sig_prefix = (_geometry_key(params),)
+        self._params_sig_version = params.version
         self.nesting_engine = NestingEngine(params)
+        self._pool = QThreadPool.globalInstance()
         self._active_worker: NestingWorker | None = None
         self._worker_context: Dict[str, Any] = {}
         self._progress_dialog: QProgressDialog | None = None
+        self._rendering = False
 
         
 
         # Track current state for cache optimization
 
-        self._current_state = {
-
-            'medianil_x': 0.0,
-
-            'medianil_y': 0.0,
-
-            'tiles_x': 1,
-
-            'tiles_y': 1,
-
-            'paso_y': 0.5,
-
-            'paso_x': 0.1,
-
-            'clearance': 0.0,
-
-            'objective': "width"
-
-        }
+        self._current_state = _CurrentState()
 
         
 
@@ -158,12 +241,56 @@ class TileTab(QWidget):
 
         self.sb_tiros_minimos = None
 
+        # Spinbox values mirrored on valueChanged, read on every layout measurement
+
+        self._margins: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+
+        self._volumen = 0
+
+        self._tiros_minimos = 0
+
+        # Results group is built lazily on the first result
+
+        self._resultados_group: QGroupBox | None = None
+
+        self.lbl_res_planilla = None
+
+        self.lbl_res_x = None
+
+        self.lbl_res_y = None
+
+        self.lbl_res_tiros = None
+
+        # Texts currently shown by the result labels, in label order
+
+        self._result_texts: tuple = ("-", "-", "-", "-")
+
         self.scene = None
 
         self.view = None
 
         self._cache_signatures = {"width": None, "height": None}
 
+        # Key of the layout currently drawn in the scene, see _scene_render_key
+
+        self._last_render_key: tuple | None = None
+
+        # Global bbox memo, see _global_bbox
+
+        self._bbox_memo: Dict[tuple, Tuple[float, float, float, float]] = {}
+
+
+
+        # Debounce cache invalidation while spacing spinboxes are being edited
+
+        self._cache_invalidate_timer = QTimer(self)
+
+        self._cache_invalidate_timer.setSingleShot(True)
+
+        self._cache_invalidate_timer.setInterval(80)
+
+        self._cache_invalidate_timer.timeout.connect(self.clear_nesting_cache)
+
         
 
         self._setup_ui()
@@ -214,7 +341,7 @@ class TileTab(QWidget):
 
         self.view = ZoomGraphicsView(self.scene)
 
-        self.view.setBackgroundBrush(QColor(255, 255, 255))
+        self.view.setBackgroundBrush(tiled_background_brush(QColor(255, 255, 255)))
 
         self.view.setAlignment(Qt.AlignLeft | Qt.AlignTop)
 
@@ -332,17 +459,6 @@ class TileTab(QWidget):
         production_form.addRow("Volumen (cantidad de piezas):", self.sb_volumen)
         production_form.addRow("Tiros minimos:", self.sb_tiros_minimos)
         
-        resultados_group = QGroupBox("Resultados")
-        resultados_form = QFormLayout(resultados_group)
-        self.lbl_res_planilla = QLabel("-")
-        self.lbl_res_x = QLabel("-")
-        self.lbl_res_y = QLabel("-")
-        self.lbl_res_tiros = QLabel("-")
-        resultados_form.addRow("Planilla:", self.lbl_res_planilla)
-        resultados_form.addRow("X (cm):", self.lbl_res_x)
-        resultados_form.addRow("Y (cm):", self.lbl_res_y)
-        resultados_form.addRow("Tiros:", self.lbl_res_tiros)
-        
         # Add all groups to layout
         left_column.addWidget(bed_group)
         left_column.addWidget(margins_group)
@@ -356,8 +472,8 @@ class TileTab(QWidget):
 
         right_column.addWidget(tiles_group)
         right_column.addWidget(production_group)
-        right_column.addWidget(resultados_group)
         right_column.addStretch(1)
+        self._right_column = right_column
         
         return left_panel, right_panel
 
@@ -406,6 +522,20 @@ class TileTab(QWidget):
 
         self.sb_tiros_minimos.valueChanged.connect(self._on_production_changed)
 
+        self._on_production_changed()
+
+
+
+        # Mirror the margins so layout measurements do not query the spinboxes
+
+        for sb in (self.sb_sangria_izquierda, self.sb_sangria_derecha,
+
+                   self.sb_pinza, self.sb_contra_pinza):
+
+            sb.valueChanged.connect(self._on_margins_changed)
+
+        self._on_margins_changed()
+
 
 
         # Invalidate caches when spacing/search parameters change
@@ -422,17 +552,47 @@ class TileTab(QWidget):
 
         """Handle production parameter changes."""
 
-        # Update any dependent calculations
+        self._volumen = self.sb_volumen.value()
 
-        pass
+        self._tiros_minimos = self.sb_tiros_minimos.value()
+
+
+
+    def _on_margins_changed(self) -> None:
+
+        """Store the current margins (cm): left, right, pinza, contra pinza."""
+
+        self._margins = (
+
+            self.sb_sangria_izquierda.value(),
+
+            self.sb_sangria_derecha.value(),
+
+            self.sb_pinza.value(),
+
+            self.sb_contra_pinza.value()
+
+        )
 
 
 
     def _on_spacing_params_changed(self) -> None:
 
-        """Clear caches when spacing/search parameters change."""
+        """Schedule a cache clear when spacing/search parameters change."""
 
-        self.clear_nesting_cache()
+        self._cache_invalidate_timer.start()
+
+
+
+    def _flush_pending_cache_invalidation(self) -> None:
+
+        """Apply a pending debounced cache clear before reading the caches."""
+
+        if self._cache_invalidate_timer.isActive():
+
+            self._cache_invalidate_timer.stop()
+
+            self.clear_nesting_cache()
 
 
 
@@ -464,14 +624,28 @@ class TileTab(QWidget):
 
         """
 
+        if self._rendering:
+
+            self.logger.debug("Render ya en curso; se ignora la llamada reentrante.")
+
+            return
+
+        self._rendering = True
+
         try:
 
+            self._flush_pending_cache_invalidation()
+
             # Read current parameters
-            self._yield_ui_events()
 
-            x_min, x_max, y_min, y_max = self._read_bed_limits()
+            bed_limits = self._read_bed_limits()
 
-            self._update_bed_limits(x_min, x_max, y_min, y_max)
+            self._update_bed_limits(bed_limits)
+
+            # Bed unchanged and already fitted: keep the current transform so
+            # cached item pixmaps stay valid
+
+            refit_view = not self._view_fit_done
 
             tiles_x = int(self.sb_tiles_x.value())
 
@@ -491,18 +665,31 @@ class TileTab(QWidget):
 
             signature = self._build_cache_signature(medianil_x, medianil_y, paso_y, paso_x, clearance)
 
-            if force_recalculate or self._cache_signatures.get("width") != signature:
+            draw_args = (bed_limits, tiles_x, tiles_y, medianil_x, medianil_y, paso_y, paso_x, clearance, signature, refit_view)
+
+            # Both caches already match: nothing to regenerate, only redraw
+
+            if not force_recalculate and self._caches_are_current(signature):
+
+                cached_pattern = self.nesting_engine.nesting_cache_width.pattern_data
+
+                self._draw_only({**_PATTERN_DEFAULTS, **cached_pattern}, *draw_args)
+
+                return
+
+            stale_objectives = tuple(
+                objective for objective in ("width", "height")
+                if force_recalculate or self._cache_signatures.get(objective) != signature
+            )
+            if stale_objectives:
                 self.logger.info(
-                    "Render(width): regenerando cache base 3x2 antes de dibujar (firma %s).",
-                    signature
+                    "Render: regenerando cache base 3x2 para %s (firma %s).",
+                    ", ".join(stale_objectives), signature
                 )
-                self._generate_cache_for_objective("width", 3, 2, medianil_x, medianil_y)
-            if force_recalculate or self._cache_signatures.get("height") != signature:
-                self.logger.info(
-                    "Render(height): regenerando cache base 3x2 (firma %s) para preparación de layouts.",
-                    signature
+                self._generate_caches(
+                    3, 2, medianil_x, medianil_y, stale_objectives,
+                    force=True, force_recalculate=force_recalculate
                 )
-                self._generate_cache_for_objective("height", 3, 2, medianil_x, medianil_y)
 
             cache_obj = self.nesting_engine.nesting_cache_width
 
@@ -516,29 +703,23 @@ class TileTab(QWidget):
 
             )
 
-            self.logger.debug(
-                "Render(width) cache check: signature=%s cached=%s pattern=%s force=%s -> use_cache=%s",
-                signature,
-                self._cache_signatures.get("width"),
-                cache_obj.pattern_data is not None,
-                force_recalculate,
-                can_use_cache
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Render(width) cache check: signature=%s cached=%s pattern=%s force=%s -> use_cache=%s",
+                    signature,
+                    self._cache_signatures.get("width"),
+                    cache_obj.pattern_data is not None,
+                    force_recalculate,
+                    can_use_cache
+                )
 
             
 
             # Use nesting engine for calculations
             if can_use_cache and cache_obj.pattern_data is not None:
                 self.logger.info("Render(width): utilizando patrón cacheado para dibujar %dx%d tiles.", tiles_x, tiles_y)
-                nesting_result = dict(cache_obj.pattern_data)
-                nesting_result.setdefault('dx2', cache_obj.pattern_data.get('dx2', 0.0))
-                nesting_result.setdefault('dy2', cache_obj.pattern_data.get('dy2', 0.0))
-                nesting_result.setdefault('dx3', cache_obj.pattern_data.get('dx3', 0.0))
-                nesting_result.setdefault('dy3', cache_obj.pattern_data.get('dy3', 0.0))
-                nesting_result.setdefault('rot1', cache_obj.pattern_data.get('rot1', 0))
-                nesting_result.setdefault('rot2', cache_obj.pattern_data.get('rot2', 0))
+                nesting_result = {**_PATTERN_DEFAULTS, **cache_obj.pattern_data}
             else:
-                self._yield_ui_events()
                 nesting_result = self.nesting_engine.calculate_optimal_nesting(
                     tiles_x=tiles_x,
                     tiles_y=tiles_y,
@@ -553,70 +734,157 @@ class TileTab(QWidget):
 
             
 
-            self._yield_ui_events()
+            self._draw_only(nesting_result, *draw_args)
 
-            if nesting_result:
+        except ValueError as limit_error:
 
-                # Clear and draw bed
+            QMessageBox.warning(self, "Nesting", str(limit_error))
 
-                self.scene.clear_scene()
+        except Exception as e:
 
-                bed_rect = self.scene.draw_bed(x_min, x_max, y_min, y_max)
+            self.logger.error("Error rendering nesting: %s", e, exc_info=True)
 
-                
+            QMessageBox.critical(self, "Error al renderizar", str(e))
 
-                # Draw tiling pattern
+        finally:
 
-                self.scene.draw_tiling_pattern(nesting_result, tiles_x, tiles_y, medianil_x, medianil_y)
-                self._yield_ui_events()
+            self._rendering = False
 
-                
 
-                # Update current state
 
-                self._update_current_state(
+    def _draw_only(self, nesting_result: Optional[dict], bed_limits: Tuple[float, float, float, float],
 
-                    medianil_x, medianil_y, tiles_x, tiles_y, paso_y, paso_x, clearance, "width"
+                   tiles_x: int, tiles_y: int, medianil_x: float, medianil_y: float,
 
-                )
+                   paso_y: float, paso_x: float, clearance: float, signature: tuple,
 
-                self._cache_signatures["width"] = signature
+                   refit_view: bool) -> None:
 
-                
+        """
+
+        Draw the bed and the given nesting result (or a simple tile) without running a search.
+
+        Drawing a result also records ``signature`` as the width cache
+        signature, since the width cache now holds the pattern for it.
+
+        """
+
+        x_min, x_max, y_min, y_max = bed_limits
+
+        if nesting_result:
+
+            # Draw bed and tiling pattern (skipped if the scene already shows them)
+
+            render_key = self._scene_render_key("width", signature, tiles_x, tiles_y, bed_limits)
+
+            bed_rect = self._render_scene(
+
+                nesting_result, tiles_x, tiles_y, medianil_x, medianil_y, bed_limits, render_key, force=refit_view
+
+            )
+
+            
+
+            # Update current state
+
+            self._update_current_state(
+
+                medianil_x, medianil_y, tiles_x, tiles_y, paso_y, paso_x, clearance, "width"
+
+            )
+
+            self._cache_signatures["width"] = signature
+
+            
 
-                # Update view
+            # Update view
+
+            if refit_view:
 
                 self._fit_layout_to_view(bed_rect)
 
-                
+            
 
-                self.logger.debug("Nesting rendered successfully")
+            self.logger.debug("Nesting rendered successfully")
 
-            else:
+        else:
+
+            # Draw simple tile as fallback
+
+            self.scene.clear_scene()
 
-                # Draw simple tile as fallback
+            self._last_render_key = None
 
-                self.scene.clear_scene()
+            bed_rect = self.scene.draw_bed(x_min, x_max, y_min, y_max)
 
-                bed_rect = self.scene.draw_bed(x_min, x_max, y_min, y_max)
+            self.scene.draw_simple_tile()
 
-                self.scene.draw_simple_tile()
+            if refit_view:
 
                 self._fit_layout_to_view(bed_rect)
 
-                self.logger.warning("No nesting result available, using simple tile")
+            self.logger.warning("No nesting result available, using simple tile")
 
-            
 
-        except ValueError as limit_error:
 
-            QMessageBox.warning(self, "Nesting", str(limit_error))
+    def _scene_render_key(self, objective: str, signature: Optional[tuple], tiles_x: int, tiles_y: int,
 
-        except Exception as e:
+                          bed_limits: Tuple[float, float, float, float]) -> Optional[tuple]:
+
+        """
+
+        Identify what a tiling draw would put in the scene.
+
+        The pattern is fully determined by the objective and the cache
+        signature, so an equal key means the scene already shows this layout.
+        Without a signature there is nothing to compare and None is returned.
+
+        """
+
+        if signature is None:
+
+            return None
+
+        scene = self.scene
+
+        margins = (scene.margin_left, scene.margin_right, scene.margin_top, scene.margin_bottom)
+
+        return (objective, signature, tiles_x, tiles_y, bed_limits, margins)
 
-            self.logger.error("Error rendering nesting: %s", e, exc_info=True)
 
-            QMessageBox.critical(self, "Error al renderizar", str(e))
+
+    def _render_scene(self, nesting_result: dict, tiles_x: int, tiles_y: int,
+
+                      medianil_x: float, medianil_y: float,
+
+                      bed_limits: Tuple[float, float, float, float],
+
+                      render_key: Optional[tuple], force: bool = False) -> QRectF:
+
+        """
+
+        Clear the scene and draw the bed plus tiling pattern, unless it already shows ``render_key``.
+
+        Returns:
+            The bed rectangle in scene coordinates
+
+        """
+
+        if not force and render_key is not None and render_key == self._last_render_key:
+
+            self.logger.debug("Escena sin cambios; se omite el redibujado.")
+
+            return self.scene.bed_rect
+
+        self.scene.clear_scene()
+
+        bed_rect = self.scene.draw_bed(*bed_limits)
+
+        self.scene.draw_tiling_pattern(nesting_result, tiles_x, tiles_y, medianil_x, medianil_y)
+
+        self._last_render_key = render_key
+
+        return bed_rect
 
 
 
@@ -632,25 +900,23 @@ class TileTab(QWidget):
 
         """
 
-        self._current_state.update({
+        state = self._current_state
 
-            'medianil_x': medianil_x,
+        state.medianil_x = medianil_x
 
-            'medianil_y': medianil_y,
+        state.medianil_y = medianil_y
 
-            'tiles_x': tiles_x,
-
-            'tiles_y': tiles_y,
+        state.tiles_x = tiles_x
 
-            'paso_y': paso_y,
+        state.tiles_y = tiles_y
 
-            'paso_x': paso_x,
+        state.paso_y = paso_y
 
-            'clearance': clearance,
+        state.paso_x = paso_x
 
-            'objective': objective
+        state.clearance = clearance
 
-        })
+        state.objective = objective
 
 
 
@@ -673,8 +939,10 @@ class TileTab(QWidget):
     def _run_nesting_optimization(self, objective: str) -> None:
         """Run nesting optimization with specified objective."""
         try:
-            x_min, x_max, y_min, y_max = self._read_bed_limits()
-            self._update_bed_limits(x_min, x_max, y_min, y_max)
+            self._flush_pending_cache_invalidation()
+            bed_limits = self._read_bed_limits()
+            self._update_bed_limits(bed_limits)
+            x_min, x_max, y_min, y_max = bed_limits
             tiles_x = int(self.sb_tiles_x.value())
             tiles_y = int(self.sb_tiles_y.value())
             paso_y = self.sb_paso_y.value()
@@ -695,30 +963,24 @@ class TileTab(QWidget):
                 self._cache_signatures.get(objective) == signature
             )
 
-            self.logger.debug(
-                "Run nesting (%s): signature=%s cached=%s pattern=%s -> use_cache=%s",
-                objective,
-                signature,
-                self._cache_signatures.get(objective),
-                cache_obj.pattern_data is not None,
-                can_use_cache
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Run nesting (%s): signature=%s cached=%s pattern=%s -> use_cache=%s",
+                    objective,
+                    signature,
+                    self._cache_signatures.get(objective),
+                    cache_obj.pattern_data is not None,
+                    can_use_cache
+                )
             if can_use_cache:
                 self.logger.info("Nesting (%s): cache detectado (firma %s). Se reutilizará el patrón almacenado.", objective, signature)
             else:
                 self.logger.info("Nesting (%s): cache no disponible (firma %s). Se recalculará el patrón.", objective, signature)
 
-            engine_args = {
-                "tiles_x": tiles_x,
-                "tiles_y": tiles_y,
-                "paso_y": paso_y,
-                "paso_x": paso_x,
-                "clearance_cm": clearance,
-                "medianil_x": medianil_x,
-                "medianil_y": medianil_y,
-                "objective": objective,
-                "force_recalculate": not can_use_cache,
-            }
+            engine_args = EngineArgs(
+                tiles_x, tiles_y, paso_y, paso_x, clearance,
+                medianil_x, medianil_y, objective, not can_use_cache
+            )
             context = {
                 "engine_args": engine_args,
                 "signature": signature,
@@ -728,15 +990,7 @@ class TileTab(QWidget):
 
             if can_use_cache and cache_obj.pattern_data is not None and cache_obj.cache_key is not None:
                 self.logger.debug("Nesting (%s): usando patrón cacheado directamente, sin worker.", objective)
-                context["start_time"] = time.perf_counter()
-                self._worker_context = context
-                payload = {
-                    "nesting_result": cache_obj.pattern_data,
-                    "cache_entry": cache_obj.pattern_data,
-                    "cache_key": cache_obj.cache_key,
-                }
-                self._on_nesting_worker_success(payload)
-                self._worker_context = {}
+                self._deliver_cached_result(cache_obj, context)
                 return
 
             self._start_nesting_worker(engine_args, context, f"Calculando nesting ({objective})...", show_progress=False)
@@ -752,8 +1006,9 @@ class TileTab(QWidget):
         """
 
         try:
-            volumen = self.sb_volumen.value()
-            tiros_minimos = self.sb_tiros_minimos.value()
+            self._flush_pending_cache_invalidation()
+            volumen = self._volumen
+            tiros_minimos = self._tiros_minimos
 
             if volumen == 0:
                 mensaje = self._format_alert_message([
@@ -765,16 +1020,14 @@ class TileTab(QWidget):
             x_min_roland, x_max_roland, y_min_roland, y_max_roland = self._read_bed_limits()
             medianil_x = self.sb_medianil_x.value()
             medianil_y = self.sb_medianil_y.value()
-            self._yield_ui_events()
 
-            self.logger.info("Generating cache for both nesting objectives...")
-            self._yield_ui_events()
-
-            self._generate_cache_for_objective("width", 3, 2, medianil_x, medianil_y)
-            self._yield_ui_events()
-
-            self._generate_cache_for_objective("height", 3, 2, medianil_x, medianil_y)
-            self._yield_ui_events()
+            signature = self._read_cache_signature(medianil_x, medianil_y)
+            if self._caches_are_current(signature):
+                self.logger.info("Optimizar planilla: caches de ambos objetivos vigentes (firma %s).", signature)
+            else:
+                self.logger.info("Generating cache for both nesting objectives...")
+                self._generate_caches(3, 2, medianil_x, medianil_y)
+                self._yield_ui_events()
 
             self.logger.info("Calculating optimal layout for width minimization...")
             layout_width = self._calculate_layout_for_objective(
@@ -791,7 +1044,6 @@ class TileTab(QWidget):
             self._yield_ui_events()
 
             layout_optimo = self._compare_layouts(layout_width, layout_height)
-            self._yield_ui_events()
 
             if not layout_optimo:
                 mensaje = self._format_alert_message([
@@ -817,13 +1069,21 @@ class TileTab(QWidget):
             QMessageBox.critical(self, "Error en Optimizacion", mensaje)
 
 
-    def _generate_cache_for_objective(self, objective: str, tiles_x_base: int, 
+    def _generate_caches(self, tiles_x_base: int, tiles_y_base: int,
 
-                                    tiles_y_base: int, medianil_x: float, medianil_y: float) -> None:
+                         medianil_x: float, medianil_y: float,
+
+                         objectives: Tuple[str, ...] = ("width", "height"),
+
+                         force: bool = False, force_recalculate: bool = False) -> None:
 
         """
 
-        Generate cache for specific nesting objective.
+        Generate the base caches for several nesting objectives in one engine pass.
+
+        Objectives whose cache already matches the current signature are skipped
+        unless ``force`` is set; ``force_recalculate`` also keeps the engine from
+        restoring previously computed patterns.
 
         """
 
@@ -837,33 +1097,41 @@ class TileTab(QWidget):
 
             signature = self._build_cache_signature(medianil_x, medianil_y, paso_y, paso_x, clearance)
 
-            cache_obj = (self.nesting_engine.nesting_cache_width 
+            pending = []
 
-                         if objective == "width" else self.nesting_engine.nesting_cache_height)
+            for objective in objectives:
 
-            
+                cache_obj = (self.nesting_engine.nesting_cache_width 
 
-            cache_is_current = cache_obj.pattern_data is not None and self._cache_signatures.get(objective) == signature
+                             if objective == "width" else self.nesting_engine.nesting_cache_height)
 
-            if cache_is_current:
+                cache_is_current = cache_obj.pattern_data is not None and self._cache_signatures.get(objective) == signature
 
-                self.logger.debug(
+                if cache_is_current and not force:
 
-                    "Skipping cache generation for %s (geometría, medianil y parámetros sin cambios).",
+                    self.logger.debug(
 
-                    objective
+                        "Skipping cache generation for %s (geometría, medianil y parámetros sin cambios).",
 
-                )
-                self.logger.info("Optimizar planilla: cache detectado para objetivo %s (firma %s); se reutiliza plantilla 3x2.", objective, signature)
+                        objective
+
+                    )
+                    self.logger.info("Optimizar planilla: cache detectado para objetivo %s (firma %s); se reutiliza plantilla 3x2.", objective, signature)
+
+                    continue
+
+                pending.append(objective)
+
+            if not pending:
 
                 return
 
             
 
-            # Use nesting engine to generate cache
+            # Use nesting engine to generate every stale cache at once
 
             self._yield_ui_events()
-            result = self.nesting_engine.calculate_optimal_nesting(
+            results = self.nesting_engine.generate_caches(
 
                 tiles_x=tiles_x_base,
 
@@ -879,24 +1147,26 @@ class TileTab(QWidget):
 
                 medianil_y=medianil_y,
 
-                objective=objective,
+                objectives=tuple(pending),
 
-                force_recalculate=True
+                force_recalculate=force_recalculate
 
             )
 
             self._yield_ui_events()
 
-            if result:
+            for objective in pending:
+
+                if results.get(objective):
 
-                self._cache_signatures[objective] = signature
-                self.logger.info("Optimizar planilla: cache regenerado para objetivo %s (firma %s).", objective, signature)
+                    self._cache_signatures[objective] = signature
+                    self.logger.info("Optimizar planilla: cache regenerado para objetivo %s (firma %s).", objective, signature)
 
             
 
         except Exception as e:
 
-            self.logger.error("Error generating cache for %s: %s", objective, e)
+            self.logger.error("Error generating caches for %s: %s", ", ".join(objectives), e)
 
 
 
@@ -984,71 +1254,53 @@ class TileTab(QWidget):
 
         try:
 
+            self._yield_ui_events()
+
+            bbox_for = self._global_bbox
+
+            # Margins are additive and loop invariant
+
+            margin_x, margin_y = self._get_margin_totals()
+
+            def ancho_total(tiles_x: int, tiles_y: int) -> float:
+                bbox = bbox_for(tiles_x, tiles_y, medianil_x, medianil_y, objective)
+                return (bbox[2] - bbox[0]) + margin_x
+
+            def alto_total(tiles_x: int, tiles_y: int) -> float:
+                bbox = bbox_for(tiles_x, tiles_y, medianil_x, medianil_y, objective)
+                return (bbox[3] - bbox[1]) + margin_y
+
+
+
             # Find minimum tiles_x using nesting engine
 
-            tiles_x_min = 1
-            while True:
-                self._yield_ui_events()
-                bbox = self.nesting_engine.calculate_global_bbox(tiles_x_min, 1, medianil_x, medianil_y, objective)
-                ancho_raw = bbox[2] - bbox[0]
-                alto_raw = bbox[3] - bbox[1]
-                ancho_total, _ = self._apply_margins_to_dims(ancho_raw, alto_raw)
-                if ancho_total >= x_min_roland:
-                    break
-                tiles_x_min += 1
-                if tiles_x_min > 100:
-                    return None
+            tiles_x_min = self._first_tiles_count(lambda n: ancho_total(n, 1) >= x_min_roland, 1, 100)
+            if tiles_x_min > 100:
+                return None
 
 
 
             # Find minimum tiles_y
 
-            tiles_y_min = 1
-            while True:
-                self._yield_ui_events()
-                bbox = self.nesting_engine.calculate_global_bbox(tiles_x_min, tiles_y_min, medianil_x, medianil_y, objective)
-                ancho_raw = bbox[2] - bbox[0]
-                alto_raw = bbox[3] - bbox[1]
-                _, alto_total = self._apply_margins_to_dims(ancho_raw, alto_raw)
-                if alto_total >= y_min_roland:
-                    break
-                tiles_y_min += 1
-                if tiles_y_min > 100:
-                    return None
+            tiles_y_min = self._first_tiles_count(lambda n: alto_total(tiles_x_min, n) >= y_min_roland, 1, 100)
+            if tiles_y_min > 100:
+                return None
 
 
 
-            # Find maximum tiles_x
+            # Find maximum tiles_x (capped at 101 tiles)
 
-            tiles_x_max = tiles_x_min
-            while True:
-                self._yield_ui_events()
-                bbox = self.nesting_engine.calculate_global_bbox(tiles_x_max + 1, 1, medianil_x, medianil_y, objective)
-                ancho_raw = bbox[2] - bbox[0]
-                alto_raw = bbox[3] - bbox[1]
-                ancho_total, _ = self._apply_margins_to_dims(ancho_raw, alto_raw)
-                if ancho_total > x_max_roland:
-                    break
-                tiles_x_max += 1
-                if tiles_x_max > 100:
-                    break
+            tiles_x_max = self._first_tiles_count(
+                lambda n: ancho_total(n, 1) > x_max_roland, tiles_x_min + 1, 101
+            ) - 1
 
 
 
             # Find maximum tiles_y
 
-            tiles_y_max = tiles_y_min
-            while True:
-                self._yield_ui_events()
-                bbox = self.nesting_engine.calculate_global_bbox(tiles_x_max, tiles_y_max + 1, medianil_x, medianil_y, objective)
-                ancho_raw = bbox[2] - bbox[0]
-                alto_raw = bbox[3] - bbox[1]
-                _, alto_total = self._apply_margins_to_dims(ancho_raw, alto_raw)
-                if alto_total > y_max_roland:
-                    break
-                tiles_y_max += 1
-                if tiles_y_max > 100:
-                    break
+            tiles_y_max = self._first_tiles_count(
+                lambda n: alto_total(tiles_x_max, n) > y_max_roland, tiles_y_min + 1, 101
+            ) - 1
 
 
 
@@ -1064,6 +1316,35 @@ class TileTab(QWidget):
 
 
 
+    @staticmethod
+    def _first_tiles_count(predicate, low: int, high: int) -> int:
+
+        """
+
+        Return the smallest count in [low, high] for which ``predicate`` holds, or high + 1.
+
+        The global bounding box only grows when tiles are added, so the
+        size predicates are monotonic and a bisection finds the same count
+        as a linear scan with O(log n) bounding box evaluations.
+
+        """
+
+        while low <= high:
+
+            mid = (low + high) // 2
+
+            if predicate(mid):
+
+                high = mid - 1
+
+            else:
+
+                low = mid + 1
+
+        return low
+
+
+
     def _calculate_production_metrics(self, tiles_x_min: int, tiles_y_min: int,
 
                                     tiles_x_max: int, tiles_y_max: int,
@@ -1164,39 +1445,58 @@ class TileTab(QWidget):
 
         """Find intermediate layout matching required tile count."""
 
-        factores_posibles = []
+        mejor_factor = None
+
+        mejor_area = math.inf
+
+        # Bed limits and margins are the same for every candidate
+
+        try:
+
+            x_min, x_max, y_min, y_max = self._read_bed_limits()
+
+        except ValueError:
+
+            return (tiles_x_max, tiles_y_max)
+
+        margin_x, margin_y = self._get_margin_totals()
 
         
 
+        # Only divisor pairs of the required count can match, one ty per tx
+
         for tx in range(tiles_x_min, tiles_x_max + 1):
 
-            for ty in range(tiles_y_min, tiles_y_max + 1):
+            if total_tiles_necesario % tx:
 
-                self._yield_ui_events()
+                continue
 
-                if tx * ty == total_tiles_necesario:
+            ty = total_tiles_necesario // tx
 
-                    bbox = self.nesting_engine.calculate_global_bbox(tx, ty, medianil_x, medianil_y, objective)
+            if not tiles_y_min <= ty <= tiles_y_max:
 
-                    ancho = bbox[2] - bbox[0]
+                continue
 
-                    alto = bbox[3] - bbox[1]
+            bbox = self._global_bbox(tx, ty, medianil_x, medianil_y, objective)
 
-                    ancho_total, alto_total = self._apply_margins_to_dims(ancho, alto)
-                    try:
-                        self._ensure_layout_within_limits(ancho_total, alto_total)
-                    except ValueError:
-                        continue
-                    area_total = ancho_total * alto_total
-                    factores_posibles.append((tx, ty, area_total, ancho_total, alto_total))
+            ancho_total = (bbox[2] - bbox[0]) + margin_x
 
-        
+            alto_total = (bbox[3] - bbox[1]) + margin_y
+
+            if not self._fits_bed_limits(ancho_total, alto_total, x_min, x_max, y_min, y_max):
 
-        if factores_posibles:
+                continue
+            area_total = ancho_total * alto_total
+            # Strict comparison keeps the first candidate on ties
+            if area_total < mejor_area:
+                mejor_area = area_total
+                mejor_factor = (tx, ty)
 
-            mejor_factor = min(factores_posibles, key=lambda x: x[2])
+        
+
+        if mejor_factor:
 
-            return (mejor_factor[0], mejor_factor[1])
+            return mejor_factor
 
         
 
@@ -1210,7 +1510,7 @@ class TileTab(QWidget):
                             volumen: int, tiros_minimos: int) -> dict:
         """Create layout result dictionary with layout metadata."""
 
-        bbox = self.nesting_engine.calculate_global_bbox(tiles_x, tiles_y, medianil_x, medianil_y, objective)
+        bbox = self._global_bbox(tiles_x, tiles_y, medianil_x, medianil_y, objective)
         ancho_raw = bbox[2] - bbox[0]
         alto_raw = bbox[3] - bbox[1]
         ancho, alto = self._apply_margins_to_dims(ancho_raw, alto_raw)
@@ -1243,41 +1543,16 @@ class TileTab(QWidget):
 
         """Compare two layouts and select the best one."""
 
-        if not layout_width and not layout_height:
-
-            return None
-
-        elif not layout_width:
-
-            return layout_height
-
-        elif not layout_height:
-
-            return layout_width
-
-        
-
-        # Primary criterion: more total tiles
-
-        if layout_width['total_tiles'] > layout_height['total_tiles']:
+        # More total tiles wins, then smaller area; height is listed first so
+        # it keeps winning exact ties
 
-            return layout_width
+        candidates = [layout for layout in (layout_height, layout_width) if layout]
 
-        elif layout_height['total_tiles'] > layout_width['total_tiles']:
+        if not candidates:
 
-            return layout_height
-
-        else:
-
-            # Tie-breaker: smaller area
-
-            if layout_width['area'] < layout_height['area']:
-
-                return layout_width
-
-            else:
+            return None
 
-                return layout_height
+        return max(candidates, key=lambda layout: (layout['total_tiles'], -layout['area']))
 
 
 
@@ -1305,6 +1580,14 @@ class TileTab(QWidget):
 
         
 
+        paso_y = self.sb_paso_y.value()
+
+        paso_x = self.sb_paso_x.value()
+
+        clearance = self.sb_clearance.value()
+
+        
+
         # Render with optimal layout using nesting engine
 
         nesting_result = self.nesting_engine.calculate_optimal_nesting(
@@ -1313,11 +1596,11 @@ class TileTab(QWidget):
 
             tiles_y=tiles_y_optimo,
 
-            paso_y=self.sb_paso_y.value(),
+            paso_y=paso_y,
 
-            paso_x=self.sb_paso_x.value(),
+            paso_x=paso_x,
 
-            clearance_cm=self.sb_clearance.value(),
+            clearance_cm=clearance,
 
             medianil_x=medianil_x,
 
@@ -1333,17 +1616,22 @@ class TileTab(QWidget):
 
         if nesting_result:
             # Clear and draw
-            x_min, x_max, y_min, y_max = self._read_bed_limits()
-            self._update_bed_limits(x_min, x_max, y_min, y_max)
+            bed_limits = self._read_bed_limits()
+            self._update_bed_limits(bed_limits)
             self._update_scene_margins()
-            self.scene.clear_scene()
-            bed_rect = self.scene.draw_bed(x_min, x_max, y_min, y_max)
-            self.scene.draw_tiling_pattern(nesting_result, tiles_x_optimo, tiles_y_optimo, medianil_x, medianil_y)
+            render_key = self._scene_render_key(
+                objetivo_optimo,
+                self._build_cache_signature(medianil_x, medianil_y, paso_y, paso_x, clearance),
+                tiles_x_optimo, tiles_y_optimo, bed_limits
+            )
+            bed_rect = self._render_scene(
+                nesting_result, tiles_x_optimo, tiles_y_optimo, medianil_x, medianil_y, bed_limits, render_key
+            )
             self._fit_layout_to_view(bed_rect)
         
         medida_x_total = layout_optimo['ancho']
         medida_y_total = layout_optimo['alto']
-        tiros_req = layout_optimo.get('tiros_necesarios', self._compute_tiros(layout_optimo['total_tiles']))
+        tiros_req = self._layout_tiros(layout_optimo)
         self._update_resultados(
             layout_optimo['total_tiles'], medida_x_total, medida_y_total, tiros_req
         )
@@ -1358,34 +1646,14 @@ class TileTab(QWidget):
                                      layout_height: Optional[dict], volumen: int, tiros_minimos: int) -> str:
         """Prepare a compact, well spaced rich-text summary of the optimization results."""
 
-        sections: list[str] = []
-
-        if layout_width:
-            sections.append(self._format_message_section(
-                "Resultado para minimizar ancho",
-                [
-                    ("Tipo de encastre:", "minimizar ancho"),
-                    ("Cantidad de tiles en X:", layout_width['tiles_x']),
-                    ("Cantidad de tiles en Y:", layout_width['tiles_y']),
-                    ("Planilla:", layout_width['total_tiles']),
-                    ("Medida en X de la planilla:", f"{layout_width['ancho']:.2f} cm"),
-                    ("Medida en Y de la planilla:", f"{layout_width['alto']:.2f} cm"),
-                    ("Área de la planilla:", f"{layout_width['area']:.2f} cm<sup>2</sup>"),
-                ]
-            ))
+        parts: list[str] = []
 
-        if layout_height:
-            sections.append(self._format_message_section(
-                "Resultado para minimizar alto",
-                [
-                    ("Tipo de encastre:", "minimizar alto"),
-                    ("Cantidad de tiles en X:", layout_height['tiles_x']),
-                    ("Cantidad de tiles en Y:", layout_height['tiles_y']),
-                    ("Planilla:", layout_height['total_tiles']),
-                    ("Medida en X de la planilla:", f"{layout_height['ancho']:.2f} cm"),
-                    ("Medida en Y de la planilla:", f"{layout_height['alto']:.2f} cm"),
-                    ("Área de la planilla:", f"{layout_height['area']:.2f} cm<sup>2</sup>"),
-                ]
+        for layout, tipo_encastre in ((layout_width, "minimizar ancho"), (layout_height, "minimizar alto")):
+            if not layout:
+                continue
+            parts.append(_layout_section_html(
+                tipo_encastre, layout['tiles_x'], layout['tiles_y'], layout['total_tiles'],
+                layout['ancho'], layout['alto'], layout['area']
             ))
 
         tipo_planilla_flag = layout_optimo.get('planilla_tipo', '').lower()
@@ -1406,22 +1674,19 @@ class TileTab(QWidget):
                 tipo_planilla_str = "Planilla intermedia"
 
         tipo_encastre_elegido = "minimizar ancho" if layout_optimo['objective'] == "width" else "minimizar alto"
-        tiros_necesarios = layout_optimo.get(
-            'tiros_necesarios',
-            self._compute_tiros(layout_optimo['total_tiles'])
+        tiros_necesarios = self._layout_tiros(layout_optimo)
+
+        parts += (
+            "<div style='border-top:1px solid #d6d6d6;margin-top:6px;padding-top:8px;'>",
+            f"<div><span style='color:#5a5a5a;'>Tipo de encastre elegido:</span> <b>{tipo_encastre_elegido}</b></div>",
+            f"<div>{tipo_planilla_str}</div>",
+            f"<div>Volumen: {volumen} piezas</div>",
+            f"<div>Tiros minimos: {tiros_minimos}</div>",
+            f"<div>Tiros necesarios: {tiros_necesarios}</div>",
+            "</div>",
         )
 
-        resumen = (
-            "<div style='border-top:1px solid #d6d6d6;margin-top:6px;padding-top:8px;'>"
-            f"<div><span style='color:#5a5a5a;'>Tipo de encastre elegido:</span> <b>{tipo_encastre_elegido}</b></div>"
-            f"<div>{tipo_planilla_str}</div>"
-            f"<div>Volumen: {volumen} piezas</div>"
-            f"<div>Tiros minimos: {tiros_minimos}</div>"
-            f"<div>Tiros necesarios: {tiros_necesarios}</div>"
-            "</div>"
-        )
-
-        return self._wrap_message_html("".join(sections) + resumen)
+        return self._wrap_message_html("".join(parts))
 
     def _fit_layout_to_view(self, bed_rect: QRectF | None) -> None:
 
@@ -1441,23 +1706,25 @@ class TileTab(QWidget):
 
             return
 
-        viewport_height = max(1, self.view.viewport().height())
+        view = self.view
+
+        viewport_height = max(1, view.viewport().height())
 
         scale = viewport_height / scene_height
 
-        transform = QTransform()
+        view.setTransform(QTransform.fromScale(scale, scale))
 
-        transform.scale(scale, scale)
+        # Align to top-left of scene
 
-        self.view.setTransform(transform)
+        hbar = view.horizontalScrollBar()
 
-        # Align to top-left of scene
+        hbar.setValue(hbar.minimum())
 
-        self.view.horizontalScrollBar().setValue(self.view.horizontalScrollBar().minimum())
+        vbar = view.verticalScrollBar()
 
-        self.view.verticalScrollBar().setValue(self.view.verticalScrollBar().minimum())
+        vbar.setValue(vbar.minimum())
 
-        self.view.reset_drag_zoom_limits()
+        view.reset_drag_zoom_limits()
 
         self._view_fit_done = True
 
@@ -1469,7 +1736,7 @@ class TileTab(QWidget):
 
         """Get current production volume."""
 
-        return self.sb_volumen.value()
+        return self._volumen
 
 
 
@@ -1477,20 +1744,32 @@ class TileTab(QWidget):
 
         """Get current minimum shots."""
 
-        return self.sb_tiros_minimos.value()
+        return self._tiros_minimos
+
 
 
+    def clear_nesting_cache(self, clear_pattern_store: bool = False) -> None:
 
-    def clear_nesting_cache(self) -> None:
+        """
+        Clear cached nesting patterns so next render recomputes placements.
 
-        """Clear cached nesting patterns so next render recomputes placements."""
+        The engine's content-addressed pattern store survives unless
+        ``clear_pattern_store`` is set, so returning to parameters already
+        seen still restores their pattern without searching.
+        """
 
         self.nesting_engine.nesting_cache_width.clear()
 
         self.nesting_engine.nesting_cache_height.clear()
 
+        if clear_pattern_store:
+
+            self.nesting_engine.clear_pattern_store()
+
         self._cache_signatures = {"width": None, "height": None}
 
+        self._bbox_memo.clear()
+
         self.logger.debug("Nesting caches cleared")
 
 
@@ -1501,6 +1780,9 @@ class TileTab(QWidget):
 
         self.params = new_params
 
+        self._params_sig_prefix = (_geometry_key(new_params),)
+        self._params_sig_version = new_params.version
+
         self.nesting_engine.params = self.params
 
         self.scene.params = self.params
@@ -1517,53 +1799,83 @@ class TileTab(QWidget):
 
                                paso_y: float, paso_x: float, clearance: float) -> tuple:
 
-        """Compose an immutable signature representing geometry + spacing + search params."""
+        """Compose an immutable signature representing geometry + spacing + search params.
 
-        p = self.params
+        The geometry enters as a single integer digest, so signatures stay
+        flat six-element tuples that hash and compare in constant time.
 
-        return (
+        """
+
+        return self._geometry_sig_prefix() + (medianil_x, medianil_y, paso_y, paso_x, clearance)
+
+
+
+    def _geometry_sig_prefix(self) -> tuple:
+
+        """
+        Geometry part of the cache signature.
+
+        PlanoTab edits the shared params in place and bumps their version, so
+        the digest is recomputed whenever the version moves.
+        """
+
+        params = self.params
+
+        if params.version != self._params_sig_version:
+
+            self._params_sig_prefix = (_geometry_key(params),)
+
+            self._params_sig_version = params.version
+
+        return self._params_sig_prefix
 
-            p.L, p.A, p.h, p.cIzq, p.cDer,
 
-            tuple(p.Tapas),
 
-            tuple(p.CSup),
+    def _read_cache_signature(self, medianil_x: float, medianil_y: float) -> tuple:
 
-            tuple(p.Bases),
+        """Build the cache signature from the current search spinboxes."""
 
-            tuple(p.CInf),
+        return self._build_cache_signature(
 
-            medianil_x, medianil_y, paso_y, paso_x, clearance
+            medianil_x, medianil_y, self.sb_paso_y.value(), self.sb_paso_x.value(), self.sb_clearance.value()
 
         )
 
 
 
-    def _update_scene_margins(self) -> None:
+    def _caches_are_current(self, signature: tuple) -> bool:
 
-        """Send current margin values (cm) to the scene so it can draw bbox including them."""
+        """True when both objective caches hold a pattern for ``signature``."""
 
-        self.scene.set_margins(
+        engine = self.nesting_engine
 
-            self.sb_sangria_izquierda.value(),
+        return (
 
-            self.sb_sangria_derecha.value(),
+            engine.nesting_cache_width.pattern_data is not None and
 
-            self.sb_pinza.value(),
+            engine.nesting_cache_height.pattern_data is not None and
 
-            self.sb_contra_pinza.value()
+            self._cache_signatures.get("width") == signature and
+
+            self._cache_signatures.get("height") == signature
 
         )
 
 
 
-    def _update_bed_limits(self, x_min: float, x_max: float, y_min: float, y_max: float) -> None:
+    def _update_scene_margins(self) -> None:
+
+        """Send current margin values (cm) to the scene so it can draw bbox including them."""
+
+        self.scene.set_margins(*self._margins)
 
-        """Track bed limits to know when the view needs to be refit."""
 
-        limits = (x_min, x_max, y_min, y_max)
 
-        if self._last_bed_limits != limits:
+    def _update_bed_limits(self, limits: Tuple[float, float, float, float]) -> None:
+
+        """Track bed limits, as returned by _read_bed_limits, to know when the view needs to be refit."""
+
+        if limits != self._last_bed_limits:
 
             self._view_fit_done = False
 
@@ -1571,106 +1883,138 @@ class TileTab(QWidget):
 
 
 
-    def _reset_resultados(self) -> None:
+    def _build_results_group(self) -> None:
 
-        self.lbl_res_planilla.setText("-")
+        """Create the Resultados group the first time a result is shown."""
 
-        self.lbl_res_x.setText("-")
+        resultados_group = QGroupBox("Resultados")
+        resultados_form = QFormLayout(resultados_group)
+        self.lbl_res_planilla = QLabel("-")
+        self.lbl_res_x = QLabel("-")
+        self.lbl_res_y = QLabel("-")
+        self.lbl_res_tiros = QLabel("-")
+        resultados_form.addRow("Planilla:", self.lbl_res_planilla)
+        resultados_form.addRow("X (cm):", self.lbl_res_x)
+        resultados_form.addRow("Y (cm):", self.lbl_res_y)
+        resultados_form.addRow("Tiros:", self.lbl_res_tiros)
 
-        self.lbl_res_y.setText("-")
+        # Keep the trailing stretch last
+        self._right_column.insertWidget(self._right_column.count() - 1, resultados_group)
+        self._resultados_group = resultados_group
 
-        self.lbl_res_tiros.setText("-")
 
 
+    def _reset_resultados(self) -> None:
 
-    def _apply_margins_to_dims(self, medida_x: float, medida_y: float) -> Tuple[float, float]:
+        if self._resultados_group is None:
 
-        medida_x += self.sb_sangria_izquierda.value() + self.sb_sangria_derecha.value()
+            return
 
-        medida_y += self.sb_pinza.value() + self.sb_contra_pinza.value()
+        self._set_result_texts(("-", "-", "-", "-"))
 
-        return medida_x, medida_y
 
 
+    def _set_result_texts(self, texts: tuple) -> None:
+
+        """Show ``texts`` in the result labels, touching only the labels that change."""
+
+        previous = self._result_texts
+
+        if texts == previous:
 
-    def _on_nesting_worker_success(self, payload: Dict[str, Any]) -> None:
-        ctx = self._worker_context or {}
-        engine_args = ctx.get("engine_args", {})
-        objective = engine_args.get("objective", "width")
-        nesting_result = payload.get("nesting_result")
-        if not nesting_result:
-            QMessageBox.warning(self, "Nesting", "No se pudo encontrar una solución de nesting óptima.")
             return
 
-        cache_entry = payload.get("cache_entry")
-        cache_key = payload.get("cache_key")
-        if cache_entry and cache_key:
-            target_cache = (
-                self.nesting_engine.nesting_cache_width
-                if objective == "width" else self.nesting_engine.nesting_cache_height
-            )
-            target_cache.store(cache_entry, cache_key)
+        labels = (self.lbl_res_planilla, self.lbl_res_x, self.lbl_res_y, self.lbl_res_tiros)
 
-        x_min, x_max = ctx.get("x_limits", (None, None))
-        y_min, y_max = ctx.get("y_limits", (None, None))
-        if None in (x_min, x_max, y_min, y_max):
-            x_min, x_max, y_min, y_max = self._read_bed_limits()
+        group = self._resultados_group
 
-        tiles_x = engine_args.get("tiles_x", 1)
-        tiles_y = engine_args.get("tiles_y", 1)
-        medianil_x = engine_args.get("medianil_x", 0.0)
-        medianil_y = engine_args.get("medianil_y", 0.0)
-        paso_y = engine_args.get("paso_y", 0.0)
-        paso_x = engine_args.get("paso_x", 0.0)
-        clearance = engine_args.get("clearance_cm", 0.0)
+        # Coalesce the label repaints into a single update of the group
 
-        self.scene.clear_scene()
-        bed_rect = self.scene.draw_bed(x_min, x_max, y_min, y_max)
-        self.scene.draw_tiling_pattern(nesting_result, tiles_x, tiles_y, medianil_x, medianil_y)
-        self._yield_ui_events()
+        group.setUpdatesEnabled(False)
 
-        bbox = self.nesting_engine.calculate_global_bbox(tiles_x, tiles_y, medianil_x, medianil_y, objective)
-        if not bbox:
-            QMessageBox.warning(self, "Nesting", "No se pudo calcular el bounding box del resultado.")
-            return
+        try:
 
-        medida_x_raw = bbox[2] - bbox[0]
-        medida_y_raw = bbox[3] - bbox[1]
-        medida_x_total, medida_y_total = self._apply_margins_to_dims(medida_x_raw, medida_y_raw)
-        self._ensure_layout_within_limits(medida_x_total, medida_y_total, x_min, x_max, y_min, y_max)
-        area_total = medida_x_total * medida_y_total
-        planilla = max(1, tiles_x * tiles_y)
+            for label, text, old_text in zip(labels, texts, previous):
 
-        section_title = (
-            "Resultado para minimizar ancho" if objective == "width" else "Resultado para minimizar alto"
-        )
-        tipo_encastre = "minimizar ancho" if objective == "width" else "minimizar alto"
-        rows = [
-            ("Tipo de encastre:", tipo_encastre),
-            ("Cantidad de tiles en X:", tiles_x),
-            ("Cantidad de tiles en Y:", tiles_y),
-            ("Planilla:", planilla),
-            ("Medida en X de la planilla:", f"{medida_x_total:.2f} cm"),
-            ("Medida en Y de la planilla:", f"{medida_y_total:.2f} cm"),
-            ("Área de la planilla:", f"{area_total:.2f} cm<sup>2</sup>"),
-        ]
-        mensaje = self._wrap_message_html(self._format_message_section(section_title, rows))
-        QMessageBox.information(self, "Nesting Completado", mensaje)
+                if text != old_text:
+
+                    label.setText(text)
+
+        finally:
+
+            group.setUpdatesEnabled(True)
+
+        self._result_texts = texts
+
+
+
+    def _global_bbox(self, tiles_x: int, tiles_y: int, medianil_x: float,
+
+                     medianil_y: float, objective: str) -> Tuple[float, float, float, float]:
+
+        """
+
+        Memoized ``NestingEngine.calculate_global_bbox``.
+
+        The bbox only depends on its arguments and on the cached pattern of the
+        objective, so the pattern's cache key (or the box parameters when no
+        pattern is cached) is part of the memo key. The memo is a plain dict,
+        emptied by clear_nesting_cache.
+
+        """
+
+        cache = (self.nesting_engine.nesting_cache_width
+
+                 if objective == "width" else self.nesting_engine.nesting_cache_height)
+
+        pattern_key = cache.cache_key if cache.pattern_data is not None else self._geometry_sig_prefix()
+
+        key = (pattern_key, tiles_x, tiles_y, medianil_x, medianil_y, objective)
+
+        memo = self._bbox_memo
+
+        bbox = memo.get(key)
+
+        if bbox is None:
+
+            bbox = self.nesting_engine.calculate_global_bbox(tiles_x, tiles_y, medianil_x, medianil_y, objective)
+
+            if len(memo) >= self.BBOX_MEMO_SIZE:
+
+                memo.pop(next(iter(memo)))
+
+            memo[key] = bbox
+
+        return bbox
+
+
+
+    def _get_margin_totals(self) -> Tuple[float, float]:
+
+        """Return the total (X, Y) margins added around a layout, in cm."""
+
+        izquierda, derecha, pinza, contra_pinza = self._margins
+
+        margin_x = izquierda + derecha
+
+        margin_y = pinza + contra_pinza
+
+        return margin_x, margin_y
+
+
+
+    def _apply_margins_to_dims(self, medida_x: float, medida_y: float) -> Tuple[float, float]:
+
+        margin_x, margin_y = self._get_margin_totals()
+
+        return medida_x + margin_x, medida_y + margin_y
 
-        self._update_current_state(medianil_x, medianil_y, tiles_x, tiles_y, paso_y, paso_x, clearance, objective)
-        self._fit_layout_to_view(bed_rect)
-        self._yield_ui_events()
-        tiros_req = self._compute_tiros(planilla)
-        self._update_resultados(planilla, medida_x_total, medida_y_total, tiros_req)
-        self.logger.info("Nesting optimization completed for objective: %s", objective)
 
-    def _on_nesting_worker_error(self, message: str) -> None:
-        QMessageBox.critical(self, "Nesting", message)
 
     def _on_nesting_worker_success(self, payload: Dict[str, Any]) -> None:
         ctx = self._worker_context or {}
-        engine_args = ctx.get("engine_args", {})
-        objective = engine_args.get("objective", "width")
+        engine_args = ctx.get("engine_args") or EngineArgs()
+        objective = engine_args.objective
         nesting_result = payload.get("nesting_result")
         if not nesting_result:
             QMessageBox.warning(self, "Nesting", "No se pudo encontrar una solución de nesting óptima.")
@@ -1680,11 +2024,8 @@ class TileTab(QWidget):
         cache_key = payload.get("cache_key")
         ctx_signature = ctx.get("signature")
         if cache_entry and cache_key:
-            target_cache = (
-                self.nesting_engine.nesting_cache_width
-                if objective == "width" else self.nesting_engine.nesting_cache_height
-            )
-            target_cache.store(cache_entry, cache_key)
+            # Merge the worker engine's pattern into the GUI engine (no-op on the cache-hit path)
+            self.nesting_engine.adopt_pattern(objective, cache_entry, cache_key)
             self.logger.debug("Worker delivered cache entry (%s) key=%s", objective, cache_key)
         if ctx_signature:
             self._cache_signatures[objective] = ctx_signature
@@ -1703,20 +2044,15 @@ class TileTab(QWidget):
         if None in (x_min, x_max, y_min, y_max):
             x_min, x_max, y_min, y_max = self._read_bed_limits()
 
-        tiles_x = engine_args.get("tiles_x", 1)
-        tiles_y = engine_args.get("tiles_y", 1)
-        medianil_x = engine_args.get("medianil_x", 0.0)
-        medianil_y = engine_args.get("medianil_y", 0.0)
-        paso_y = engine_args.get("paso_y", 0.0)
-        paso_x = engine_args.get("paso_x", 0.0)
-        clearance = engine_args.get("clearance_cm", 0.0)
+        tiles_x, tiles_y, paso_y, paso_x, clearance, medianil_x, medianil_y = engine_args[:7]
 
-        self.scene.clear_scene()
-        bed_rect = self.scene.draw_bed(x_min, x_max, y_min, y_max)
-        self.scene.draw_tiling_pattern(nesting_result, tiles_x, tiles_y, medianil_x, medianil_y)
-        self._yield_ui_events()
+        bed_limits = (x_min, x_max, y_min, y_max)
+        render_key = self._scene_render_key(objective, ctx_signature, tiles_x, tiles_y, bed_limits)
+        bed_rect = self._render_scene(
+            nesting_result, tiles_x, tiles_y, medianil_x, medianil_y, bed_limits, render_key
+        )
 
-        bbox = self.nesting_engine.calculate_global_bbox(tiles_x, tiles_y, medianil_x, medianil_y, objective)
+        bbox = self._global_bbox(tiles_x, tiles_y, medianil_x, medianil_y, objective)
         if not bbox:
             QMessageBox.warning(self, "Nesting", "No se pudo calcular el bounding box del resultado.")
             return
@@ -1728,26 +2064,14 @@ class TileTab(QWidget):
         area_total = medida_x_total * medida_y_total
         planilla = max(1, tiles_x * tiles_y)
 
-        section_title = (
-            "Resultado para minimizar ancho" if objective == "width" else "Resultado para minimizar alto"
-        )
         tipo_encastre = "minimizar ancho" if objective == "width" else "minimizar alto"
-        rows = [
-            ("Tipo de encastre:", tipo_encastre),
-            ("Cantidad de tiles en X:", tiles_x),
-            ("Cantidad de tiles en Y:", tiles_y),
-            ("Planilla:", planilla),
-            ("Medida en X de la planilla:", f"{medida_x_total:.2f} cm"),
-            ("Medida en Y de la planilla:", f"{medida_y_total:.2f} cm"),
-            ("Área de la planilla:", f"{area_total:.2f} cm<sup>2</sup>"),
-        ]
-        mensaje = self._wrap_message_html(self._format_message_section(section_title, rows))
+        mensaje = self._wrap_message_html(_layout_section_html(
+            tipo_encastre, tiles_x, tiles_y, planilla, medida_x_total, medida_y_total, area_total
+        ))
         QMessageBox.information(self, "Nesting Completado", mensaje)
 
-        self._cache_signatures[objective] = cache_key
         self._update_current_state(medianil_x, medianil_y, tiles_x, tiles_y, paso_y, paso_x, clearance, objective)
         self._fit_layout_to_view(bed_rect)
-        self._yield_ui_events()
         tiros_req = self._compute_tiros(planilla)
         self._update_resultados(planilla, medida_x_total, medida_y_total, tiros_req)
         self.logger.info("Nesting optimization completed for objective: %s", objective)
@@ -1755,6 +2079,20 @@ class TileTab(QWidget):
     def _on_nesting_worker_error(self, message: str) -> None:
         QMessageBox.critical(self, "Nesting", message)
 
+    def _deliver_cached_result(self, cache_obj, context: Dict[str, Any]) -> None:
+        """Feed a cached pattern through the worker success path synchronously."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            context["start_time"] = time.perf_counter()
+        self._worker_context = context
+        try:
+            self._on_nesting_worker_success({
+                "nesting_result": cache_obj.pattern_data,
+                "cache_entry": cache_obj.pattern_data,
+                "cache_key": cache_obj.cache_key,
+            })
+        finally:
+            self._worker_context = {}
+
     def _cleanup_worker(self) -> None:
         self._hide_progress_dialog()
         self._active_worker = None
@@ -1762,24 +2100,31 @@ class TileTab(QWidget):
 
     def _start_nesting_worker(
         self,
-        engine_args: Dict[str, Any],
+        engine_args: EngineArgs,
         context: Dict[str, Any],
         message: str,
         show_progress: bool = True,
     ) -> None:
+        """
+        Start a NestingWorker on the thread pool, one at a time.
+
+        _active_worker is only touched on the GUI thread, and the worker reads
+        nothing but its own engine and params copy, so no lock is needed.
+        Workers only run forced searches, so a fresh engine loses no cache.
+        """
         if self._active_worker:
             self.logger.warning("Ya existe un cálculo de nesting en ejecución")
             return
         context["start_time"] = time.perf_counter()
         self._worker_context = context
-        worker = NestingWorker(self.params, engine_args)
-        worker.result_ready.connect(self._on_nesting_worker_success)
-        worker.error.connect(self._on_nesting_worker_error)
-        worker.finished.connect(self._cleanup_worker)
+        worker = NestingWorker(NestingEngine(self.params.copy()), engine_args)
+        worker.signals.result_ready.connect(self._on_nesting_worker_success)
+        worker.signals.error.connect(self._on_nesting_worker_error)
+        worker.signals.finished.connect(self._cleanup_worker)
         self._active_worker = worker
         if show_progress:
             self._show_progress_dialog(message)
-        worker.start()
+        self._pool.start(worker)
 
     def _show_progress_dialog(self, message: str) -> None:
         if self._progress_dialog is None:
@@ -1798,6 +2143,13 @@ class TileTab(QWidget):
         if self._progress_dialog:
             self._progress_dialog.close()
             self._progress_dialog = None
+    @staticmethod
+    def _fits_bed_limits(medida_x: float, medida_y: float, x_min: float, x_max: float,
+                         y_min: float, y_max: float) -> bool:
+        """Non-raising counterpart of _ensure_layout_within_limits (same tolerance)."""
+        eps = 1e-6
+        return (x_min - eps <= medida_x <= x_max + eps) and (y_min - eps <= medida_y <= y_max + eps)
+
     def _ensure_layout_within_limits(self, medida_x: float, medida_y: float,
                                      x_min: Optional[float] = None, x_max: Optional[float] = None,
                                      y_min: Optional[float] = None, y_max: Optional[float] = None) -> None:
@@ -1824,79 +2176,43 @@ class TileTab(QWidget):
 
     def _update_resultados(self, planilla: int, medida_x: float, medida_y: float, tiros: int) -> None:
 
-        self.lbl_res_planilla.setText(str(planilla))
+        if self._resultados_group is None:
 
-        self.lbl_res_x.setText(f"{medida_x:.2f}")
+            self._build_results_group()
 
-        self.lbl_res_y.setText(f"{medida_y:.2f}")
+        self._set_result_texts((str(planilla), f"{medida_x:.2f}", f"{medida_y:.2f}", str(tiros)))
 
-        self.lbl_res_tiros.setText(str(tiros))
 
 
-
-    def _format_message_section(self, title: str, rows: list[tuple[str, str]]) -> str:
-
-        """Render a compact HTML section with a title and a key/value table."""
-
-        normalized_rows = [(label, str(value)) for label, value in rows]
-
-        table_rows = "".join(
-
-            f"<tr><td style='padding:2px 12px 2px 0;color:#5a5a5a;'>{label}</td>"
-
-            f"<td style='padding:2px 0;font-weight:600;color:#1f1f1f;'>{value}</td></tr>"
-
-            for label, value in normalized_rows
-
-        )
-
-        return (
-
-            "<div style='margin-bottom:14px;'>"
-
-            f"<div style='font-size:11pt;font-weight:600;margin-bottom:4px;'>{title}</div>"
-
-            f"<table style='border-collapse:collapse;font-size:10pt;'>{table_rows}</table>"
-
-            "</div>"
-
-        )
-
-
-
-    def _wrap_message_html(self, body: str) -> str:
+    @staticmethod
+    def _wrap_message_html(body: str) -> str:
 
         """Wrap the provided body inside a styled HTML document for QMessageBox."""
 
-        return (
-
-            "<html>"
+        return _MESSAGE_HTML.format(body)
 
-            "<body style=\"font-family:'Segoe UI',sans-serif;font-size:10pt;line-height:1.35;\">"
 
-            f"{body}"
 
-            "</body>"
+    @staticmethod
+    def _format_alert_message(lines: list[str]) -> str:
 
-            "</html>"
+        """Create a simple HTML message with consistent spacing."""
 
-        )
+        blocks = "".join(map(_ALERT_LINE_HTML.format, lines))
 
+        return _MESSAGE_HTML.format(blocks)
 
 
-    def _format_alert_message(self, lines: list[str]) -> str:
 
-        """Create a simple HTML message with consistent spacing."""
+    def _layout_tiros(self, layout: dict) -> int:
 
-        blocks = "".join(
+        """Tiros stored in a layout result; only computed when the result lacks them."""
 
-            f"<div style='margin-bottom:6px;color:#2b2b2b;'>{line}</div>"
+        if 'tiros_necesarios' in layout:
 
-            for line in lines
+            return layout['tiros_necesarios']
 
-        )
-
-        return self._wrap_message_html(blocks)
+        return self._compute_tiros(layout['total_tiles'])
 
 
 
@@ -1906,13 +2222,15 @@ class TileTab(QWidget):
 
             return 0
 
-        volumen = max(0, self.get_volumen())
+        volumen = self.get_volumen()
+
+        tiros_minimos = self.get_tiros_minimos()
 
-        tiros = math.ceil(volumen / planilla) if volumen > 0 else 0
+        # Integer ceiling division; both spinboxes hold ints
 
-        tiros = max(tiros, self.get_tiros_minimos())
+        tiros = -(-volumen // planilla) if volumen > 0 else 0
 
-        return tiros
+        return max(tiros, tiros_minimos)
 
 
 
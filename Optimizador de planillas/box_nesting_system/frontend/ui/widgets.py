@@ -7,14 +7,14 @@ import math
 from typing import List, Tuple, Optional
 
 from PySide6.QtCore import Qt, QRectF, QPointF
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPainterPath
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPainterPath, QPicture, QPixmap
 from PySide6.QtWidgets import (
     QGraphicsScene, QGraphicsView, QGraphicsRectItem, QGraphicsItem
 )
 
 from backend.models.parameters import PlanoParams, construir_shapes_px
 from backend.geometry.polygons import OrthoPoly
-from backend.geometry.render_helpers import vertices_externos_px, build_tile_orthopoly_and_edges_cm
+from backend.geometry.render_helpers import vertices_externos_px, build_aligned_tile_cm
 from backend.utils.constants import DEFAULT_COLORS, DEFAULT_CONSTANTS
 
 
@@ -29,7 +29,10 @@ class ZoomGraphicsView(QGraphicsView):
         """Initialize the zoom graphics view."""
         super().__init__(*args, **kwargs)
         self.setRenderHint(QPainter.Antialiasing, True)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing
+        )
         self.setDragMode(QGraphicsView.NoDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorViewCenter)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
@@ -58,6 +61,99 @@ class ZoomGraphicsView(QGraphicsView):
         self._zoom_locked = True
 
 
+_BACKGROUND_TILE_SIZE = 64
+_background_brushes = {}
+
+
+def tiled_background_brush(color: QColor) -> QBrush:
+    """
+    Return a background brush backed by a small solid pixmap.
+
+    Qt paints pixmap brushes with tiled blits, which is cheaper than a solid
+    fill on large viewports. Brushes are shared per color.
+
+    Args:
+        color: Background color
+
+    Returns:
+        Cached pixmap brush
+    """
+    key = color.rgba()
+    brush = _background_brushes.get(key)
+    if brush is None:
+        pixmap = QPixmap(_BACKGROUND_TILE_SIZE, _BACKGROUND_TILE_SIZE)
+        pixmap.fill(color)
+        brush = QBrush(pixmap)
+        _background_brushes[key] = brush
+    return brush
+
+
+class PictureItem(QGraphicsItem):
+    """Graphics item that replays a recorded QPicture in scene coordinates."""
+
+    def __init__(self, picture: QPicture, rect: QRectF):
+        super().__init__()
+        self._picture = picture
+        self._rect = QRectF(rect)
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def paint(self, painter, option, widget=None) -> None:
+        painter.drawPicture(0, 0, self._picture)
+
+
+class TileGridItem(QGraphicsItem):
+    """
+    Single graphics item drawing every tile of a layout.
+
+    Each tile is kept as its own (outline path, contour rects) group and the
+    groups are painted in order, one drawPath and one drawRects per tile,
+    instead of one item per shape. Holes stay local to their tile and
+    overlapping tiles stack like separate items would. The tile view is
+    locked to the bed and only refits on a new layout, so the item keeps a
+    device pixmap cache across ordinary repaints.
+    """
+
+    def __init__(self, tiles: List[Tuple[QPainterPath, List[QRectF]]], pen: QPen, brush: QBrush):
+        super().__init__()
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self._pen = pen
+        self._brush = brush
+        self._set_geometry(tiles)
+
+    def _set_geometry(self, tiles: List[Tuple[QPainterPath, List[QRectF]]]) -> None:
+        self._tiles = tiles
+        bounds = QRectF()
+        for path, rects in tiles:
+            bounds = bounds.united(path.boundingRect())
+            for rect in rects:
+                bounds = bounds.united(rect)
+        half_pen = self._pen.widthF() / 2.0
+        self._bounds = bounds.adjusted(-half_pen, -half_pen, half_pen, half_pen)
+
+    def set_geometry(self, tiles: List[Tuple[QPainterPath, List[QRectF]]]) -> None:
+        """Replace the drawn tiles, keeping the item in its scene."""
+        self.prepareGeometryChange()
+        self._set_geometry(tiles)
+        self.update()
+
+    def add_geometry(self, tiles: List[Tuple[QPainterPath, List[QRectF]]]) -> None:
+        """Append tiles on top of the ones already drawn."""
+        self.set_geometry(self._tiles + tiles)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def paint(self, painter, option, widget=None) -> None:
+        painter.setPen(self._pen)
+        for path, rects in self._tiles:
+            painter.setBrush(self._brush)
+            painter.drawPath(path)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRects(rects)
+
+
 class PlanoScene(QGraphicsScene):
     """
     Graphics scene for rendering the plano (editor) view.
@@ -71,12 +167,15 @@ class PlanoScene(QGraphicsScene):
         self.setSceneRect(0, 0, 3000, 2000)
         self.logger = logging.getLogger(__name__)
 
-    def render_plano(self, params: PlanoParams) -> None:
+    def render_plano(self, params: PlanoParams) -> QRectF:
         """
         Render the plano with given parameters.
         
         Args:
             params: Box parameters for rendering
+
+        Returns:
+            Bounding rectangle of the rendered shapes in pixels
         """
         self.clear()
         shapes = construir_shapes_px(params)
@@ -121,6 +220,34 @@ class PlanoScene(QGraphicsScene):
         for (cx, cy) in vertices_externos_px(shapes):
             self.addEllipse(QRectF(cx - lado/2, cy - lado/2, lado, lado), pen_vert)
 
+        return self._shapes_bbox(shapes)
+
+    def record_picture(self) -> Tuple[QPicture, QRectF]:
+        """
+        Record the current scene items into a QPicture.
+
+        Returns:
+            Tuple of (picture, source rect) in scene coordinates
+        """
+        rect = self.itemsBoundingRect()
+        picture = QPicture()
+        painter = QPainter(picture)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        self.render(painter, rect, rect)
+        painter.end()
+        return picture, rect
+
+    def show_picture(self, picture: QPicture, rect: QRectF) -> None:
+        """
+        Replace the scene contents with a previously recorded picture.
+
+        Args:
+            picture: Picture recorded by record_picture
+            rect: Source rect returned alongside the picture
+        """
+        self.clear()
+        self.addItem(PictureItem(picture, rect))
+
     def bounding_box_px(self, params: PlanoParams) -> QRectF:
         """
         Calculate bounding box of all shapes in pixel coordinates.
@@ -131,7 +258,11 @@ class PlanoScene(QGraphicsScene):
         Returns:
             Bounding rectangle in pixels
         """
-        shapes = construir_shapes_px(params)
+        return self._shapes_bbox(construir_shapes_px(params))
+
+    @staticmethod
+    def _shapes_bbox(shapes: List[dict]) -> QRectF:
+        """Bounding rectangle of a list of pixel shapes."""
         xs = [s['x'] for s in shapes] + [s['x'] + s['w'] for s in shapes]
         ys = [s['y'] for s in shapes] + [s['y'] + s['h'] for s in shapes]
         return QRectF(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
@@ -160,6 +291,8 @@ class TileScene(QGraphicsScene):
         # Pattern distances for current layout (set externally)
         self.pattern_distances = None
         self.bed_rect: Optional[QRectF] = None
+        # Items reused across redraws instead of being recreated
+        self._grid_item: Optional[TileGridItem] = None
         self._bbox_item: Optional[QGraphicsRectItem] = None
         self._last_bbox_rect: Optional[QRectF] = None
         self.margin_left = 0.0
@@ -208,8 +341,9 @@ class TileScene(QGraphicsScene):
         bed_pen = QPen(QColor(200, 200, 200), 1.5)
         bed_pen.setCosmetic(True)
         bed_brush = QBrush(DEFAULT_COLORS.get_bed_background())
+        if self.bed_rect != bed_rect:
+            self.setSceneRect(bed_rect)
         self.bed_rect = bed_rect
-        self.setSceneRect(bed_rect)
         
         return bed_rect
 
@@ -222,12 +356,8 @@ class TileScene(QGraphicsScene):
 
     def _update_bbox_outline(self, minx: float, miny: float, maxx: float, maxy: float) -> None:
         """Draw or refresh the bounding box outline for the current layout."""
-        if self._bbox_item:
-            try:
-                self.removeItem(self._bbox_item)
-            except RuntimeError:
-                pass
-            self._bbox_item = None
+        if self._bbox_item is not None:
+            self._bbox_item.setVisible(False)
         if not math.isfinite(minx) or not math.isfinite(miny) or not math.isfinite(maxx) or not math.isfinite(maxy):
             return
         minx -= self.margin_left
@@ -240,9 +370,13 @@ class TileScene(QGraphicsScene):
             return
         s = self.params.escala if self.params.escala != 0 else 1.0
         rect = QRectF(minx * s, miny * s, width * s, height * s)
-        pen = QPen(QColor(70, 150, 255), 2.5, Qt.SolidLine)
-        pen.setCosmetic(True)
-        self._bbox_item = self.addRect(rect, pen, Qt.NoBrush)
+        if self._bbox_item is None:
+            pen = QPen(QColor(70, 150, 255), 2.5, Qt.SolidLine)
+            pen.setCosmetic(True)
+            self._bbox_item = self.addRect(rect, pen, Qt.NoBrush)
+        else:
+            self._bbox_item.setRect(rect)
+            self._bbox_item.setVisible(True)
         self._last_bbox_rect = QRectF(minx, miny, width, height)
 
     def draw_tile(self, poly: OrthoPoly, rects: List[Tuple[str, Tuple[float, float, float, float]]], 
@@ -250,33 +384,57 @@ class TileScene(QGraphicsScene):
         """
         Draw a single tile at specified offset.
         
+        The tile is added to the tiles already shown (all of them live in the
+        shared grid item); clear_scene starts over.
+        
+        Args:
+            poly: Tile polygon
+            rects: Tile rectangles with names and dimensions
+            offset_x: X offset in cm
+            offset_y: Y offset in cm
+        """
+        tiles = [self._tile_geometry(poly, rects, offset_x, offset_y)]
+        if self._grid_item is not None and self._grid_item.isVisible():
+            self._grid_item.add_geometry(tiles)
+        else:
+            self._show_grid(tiles)
+
+    def _show_grid(self, tiles: List[Tuple[QPainterPath, List[QRectF]]]) -> None:
+        """Show the tiles through the reusable grid item."""
+        if self._grid_item is None:
+            pen_outline = QPen(DEFAULT_COLORS.get_tile_outline(), 2.0)
+            brush_fill = QBrush(DEFAULT_COLORS.get_tile_fill())
+            self._grid_item = TileGridItem(tiles, pen_outline, brush_fill)
+            self.addItem(self._grid_item)
+        else:
+            self._grid_item.set_geometry(tiles)
+            self._grid_item.setVisible(True)
+
+    def _tile_geometry(self, poly: OrthoPoly, rects: List[Tuple[str, Tuple[float, float, float, float]]],
+                       offset_x: float, offset_y: float) -> Tuple[QPainterPath, List[QRectF]]:
+        """
+        Build the outline path and contour rects of one tile in pixels.
+
         Args:
             poly: Tile polygon
             rects: Tile rectangles with names and dimensions
             offset_x: X offset in cm
             offset_y: Y offset in cm
+
+        Returns:
+            Tuple of (outline path, contour rectangles)
         """
         s = self.params.escala if self.params.escala != 0 else 1.0
-        
-        # Create copy for translation
-        poly_draw = OrthoPoly(poly.outer[:], [h[:] for h in poly.holes])
-        if offset_x or offset_y:
-            poly_draw.translate(offset_x, offset_y)
-            
-        # Draw polygon fill
+
+        # to_qpath does not modify the polygon, so only a shifted tile needs a copy
+        poly_draw = poly.translated(offset_x, offset_y) if (offset_x or offset_y) else poly
+
         path = poly_draw.to_qpath(px_per_cm=s, fill_rule_odd_even=True)
-        pen_outline = QPen(DEFAULT_COLORS.get_tile_outline(), 2.0)
-        brush_fill = QBrush(DEFAULT_COLORS.get_tile_fill())
-        self.addPath(path, pen_outline, brush_fill)
-        
-        # Draw rectangular contours
-        pen_contour = QPen(DEFAULT_COLORS.get_tile_outline(), 2.0)
-        for name, (x, y, w, h) in rects:
-            self.addRect(
-                QRectF((x + offset_x) * s, (y + offset_y) * s, w * s, h * s),
-                pen_contour, 
-                Qt.NoBrush
-            )
+        contour_rects = [
+            QRectF((x + offset_x) * s, (y + offset_y) * s, w * s, h * s)
+            for name, (x, y, w, h) in rects
+        ]
+        return path, contour_rects
 
     def draw_tiling_pattern(self, pattern_data: dict, tiles_x: int, tiles_y: int,
                           medianil_x: float, medianil_y: float) -> None:
@@ -374,29 +532,38 @@ class TileScene(QGraphicsScene):
         max_layout_x = float('-inf')
         max_layout_y = float('-inf')
 
+        tiles: List[Tuple[QPainterPath, List[QRectF]]] = []
         for poly, rects, ox, oy in positions:
             adj_x = ox - shift_x
             adj_y = oy - shift_y
-            self.draw_tile(poly, rects, adj_x, adj_y)
+            tiles.append(self._tile_geometry(poly, rects, adj_x, adj_y))
             update_bounds(poly, adj_x, adj_y)
 
+        if tiles:
+            self._show_grid(tiles)
+
         if min_layout_x < float('inf'):
             self._update_bbox_outline(min_layout_x, min_layout_y, max_layout_x, max_layout_y)
 
     def clear_scene(self) -> None:
         """
-        Clear all items from the scene.
+        Clear the scene.
+
+        The reusable grid and bounding box items are hidden rather than
+        deleted; any other item is removed.
         """
-        self.clear()
+        pooled = [item for item in (self._grid_item, self._bbox_item) if item is not None]
+        for item in self.items():
+            if item.parentItem() is None and not any(item is keep for keep in pooled):
+                self.removeItem(item)
+        for item in pooled:
+            item.setVisible(False)
 
     def draw_simple_tile(self) -> None:
         """
         Draw a simple single tile (fallback when no nesting data available).
         """
-        from backend.geometry.transformations import rotate_and_align_top_left
-        
-        poly_base, rects_base = build_tile_orthopoly_and_edges_cm(self.params)
-        poly1, rects1 = rotate_and_align_top_left(poly_base, rects_base, rot=90)
+        poly1, rects1 = build_aligned_tile_cm(self.params, 90)
         minx, miny, maxx, maxy = poly1.aabb()
         shift_x = minx - self.margin_left
         shift_y = miny - self.margin_top
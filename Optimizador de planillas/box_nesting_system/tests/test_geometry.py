@@ -7,11 +7,17 @@ import math
 from typing import List, Tuple
 
 from backend.geometry.polygons import OrthoPoly
+from backend.geometry.collision import (
+    clearance_paths_i, paths_aabb_i, aabb_may_intersect,
+    paths_intersect, polygons_intersect
+)
+from backend.geometry.render_helpers import build_aligned_tile_cm, vertices_externos_px
 from backend.geometry.transformations import (
     cm_to_i, i_to_cm, rotate_point_90cw, rotate_point_180,
     rotate_rect_generic, calculate_polygon_area
 )
 from backend.geometry.types import Point, RectCM
+from backend.models.parameters import PlanoParams, construir_shapes_px, shape_kind_from_name
 from backend.utils.constants import SCALE_INT
 
 
@@ -112,6 +118,30 @@ class TestOrthoPoly:
             assert math.isclose(x, expected_outer[i][0], abs_tol=1e-9)
             assert math.isclose(y, expected_outer[i][1], abs_tol=1e-9)
             
+    def test_translated_copy(self):
+        """Test that translated matches translate on a copy and leaves the source alone."""
+        outer = [(0, 0), (10, 0), (10, 5), (0, 5)]
+        hole = [(2, 1), (4, 1), (4, 3), (2, 3)]
+        poly = OrthoPoly(outer, [hole])
+        
+        moved = poly.translated(5.25, -3.5)
+        expected = OrthoPoly(outer, [hole])
+        expected.translate(5.25, -3.5)
+        
+        assert moved.outer == expected.outer
+        assert moved.holes == expected.holes
+        assert poly.outer == outer
+        assert poly.holes == [hole]
+        
+    def test_translated_paths_i(self):
+        """Test that translated_paths_i matches translated().to_paths_i()."""
+        poly, _ = build_aligned_tile_cm(PlanoParams(), 90)
+        holed = OrthoPoly([(0, 0), (10, 0), (10, 10), (0, 10)], [[(2, 2), (8, 2), (8, 8), (2, 8)]])
+        
+        for p in (poly, holed, OrthoPoly([])):
+            for dx, dy in ((0.0, 0.0), (0.1, 0.2), (-3.3335, 7.0005), (12.345, -0.0004)):
+                assert p.translated_paths_i(dx, dy) == p.translated(dx, dy).to_paths_i()
+                
     def test_polygon_rotation(self):
         """Test polygon rotation."""
         outer = [(0, 0), (10, 0), (10, 5), (0, 5)]
@@ -153,6 +183,74 @@ class TestPolygonArea:
         assert math.isclose(area, expected_area, abs_tol=1e-9)
 
 
+class TestCollision:
+    """Test the split collision helpers against polygons_intersect."""
+    
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.fixed, _ = build_aligned_tile_cm(PlanoParams(), 90)
+        self.moving, _ = build_aligned_tile_cm(PlanoParams(), 270)
+        
+    def _offsets(self):
+        """Grid of offsets around the fixed tile, including touching positions."""
+        minx, miny, maxx, maxy = self.fixed.aabb()
+        xs = [minx - 30 + 0.7 * i for i in range(0, 90, 3)] + [maxx, maxx + 0.1, maxx + 0.2]
+        ys = [miny - 30 + 1.1 * i for i in range(0, 60, 3)] + [maxy, maxy + 0.2]
+        return [(dx, dy) for dx in xs for dy in ys]
+        
+    def test_paths_intersect_matches_polygons_intersect(self):
+        """Test precomputed paths give the same answer as the polygon test."""
+        for clearance in (0.0, 0.2):
+            fixed_paths = clearance_paths_i(self.fixed, clearance)
+            for dx, dy in self._offsets():
+                expected = polygons_intersect(self.fixed, self.moving.translated(dx, dy), clearance)
+                assert paths_intersect(fixed_paths, self.moving.translated_paths_i(dx, dy)) == expected
+                
+    def test_aabb_precheck_never_rejects_a_collision(self):
+        """Test that aabb_may_intersect is False only when there is no collision."""
+        rejected = 0
+        for clearance in (0.0, 0.2):
+            fixed_aabb = paths_aabb_i(clearance_paths_i(self.fixed, clearance))
+            for dx, dy in self._offsets():
+                candidate = self.moving.translated(dx, dy)
+                if not aabb_may_intersect(fixed_aabb, candidate.aabb()):
+                    rejected += 1
+                    assert not polygons_intersect(self.fixed, candidate, clearance), (clearance, dx, dy)
+        # The grid reaches well outside the tile, so the precheck does reject
+        assert rejected > 0
+        
+    def test_aabb_precheck_empty_paths(self):
+        """Test that empty fixed paths never intersect."""
+        assert paths_aabb_i([]) is None
+        assert not aabb_may_intersect(None, (0.0, 0.0, 1.0, 1.0))
+        assert not paths_intersect([], self.moving.to_paths_i())
+
+
+class TestExternalVertices:
+    """Test the shape kind dispatch of vertices_externos_px."""
+    
+    def test_kind_field_matches_names(self):
+        """Test that stored kinds agree with the names they are derived from."""
+        for shp in construir_shapes_px(PlanoParams()):
+            assert shp['kind'] == shape_kind_from_name(shp['name'])
+            
+    def test_vertices_with_and_without_kind(self):
+        """Test that shapes without the kind field give the same vertices."""
+        variants = [
+            PlanoParams(),
+            PlanoParams(cDer=1.5, CInf=[0.5, 0.0, 0.5, 0.0]),
+            PlanoParams(L=8.0, A=5.0, h=3.0, CSup=[0, 0, 0, 0]),
+        ]
+        for params in variants:
+            shapes = construir_shapes_px(params)
+            legacy = [{k: v for k, v in shp.items() if k != 'kind'} for shp in shapes]
+            
+            vertices = vertices_externos_px(shapes)
+            assert vertices
+            assert len(vertices) == len(set(vertices))
+            assert set(vertices) == set(vertices_externos_px(legacy))
+
+
 class TestIntegration:
     """Integration tests for geometry operations."""
     
@@ -6,8 +6,11 @@ import pytest
 from typing import List, Dict, Any
 
 from backend.nesting.algorithms import NestingAlgorithms
+from backend.nesting import engine as engine_module
 from backend.nesting.cache import NestingCache
+from backend.nesting.engine import NestingEngine, _same_shape
 from backend.nesting.optimizer import LayoutOptimizer
+from backend.geometry.render_helpers import build_aligned_tile_cm
 from backend.geometry.polygons import OrthoPoly
 from backend.geometry.types import Point
 from backend.models.parameters import PlanoParams
@@ -76,6 +79,31 @@ class TestNestingCache:
         assert "key3" in cache.cache
         assert "key2" not in cache.cache
 
+    def test_cache_lru_eviction_order(self):
+        """Test that evictions follow least recent use, including hits."""
+        cache = NestingCache(max_size=3)
+        
+        for i in range(1, 4):
+            cache.store(f"data{i}", f"key{i}")
+            
+        # A hit and a re-store both refresh an entry
+        assert cache.get("key1") == "data1"
+        cache.store("data2b", "key2")
+        assert list(cache.cache) == ["key3", "key1", "key2"]
+        
+        cache.store("data4", "key4")
+        assert list(cache.cache) == ["key1", "key2", "key4"]
+        
+        cache.store("data5", "key5")
+        assert list(cache.cache) == ["key2", "key4", "key5"]
+        assert cache.get("key2") == "data2b"
+        
+        # Evicting the current entry drops the simple interface data too
+        cache.store("data6", "key6")
+        cache.store("data7", "key7")
+        assert list(cache.cache) == ["key2", "key6", "key7"]
+        assert cache.cache_key == "key7"
+
 
 class TestNestingAlgorithms:
     """Test cases for nesting algorithms."""
@@ -193,6 +221,288 @@ class TestLayoutOptimizer:
         assert result['total_tiles'] == 6  # layout_b has more tiles
 
 
+class LinearScene:
+    """Scene whose bounding box grows linearly with the tile counts."""
+    
+    def __init__(self, tile_w: float, tile_h: float, skew: float = 0.0):
+        self.tile_w = tile_w
+        self.tile_h = tile_h
+        self.skew = skew
+        
+    def calculate_global_bbox(self, tiles_x, tiles_y, medianil_x, medianil_y, objective):
+        width = tiles_x * (self.tile_w + medianil_x) + self.skew * tiles_y
+        height = tiles_y * (self.tile_h + medianil_y)
+        return (0.0, 0.0, width, height)
+
+
+class TestLayoutSearch:
+    """Test the bisection and divisor searches against exhaustive scans."""
+    
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.optimizer = LayoutOptimizer()
+        
+    @staticmethod
+    def _linear_first(predicate, low, high):
+        """Reference: first count in [low, high] that holds, or high + 1."""
+        for n in range(low, high + 1):
+            if predicate(n):
+                return n
+        return high + 1
+        
+    @staticmethod
+    def _linear_bounds(scene, x_min, x_max, y_min, y_max, mx, my):
+        """Reference: layout bounds by linear scans (minimums up to 100, maximums up to 101)."""
+        def ancho(tx, ty):
+            bbox = scene.calculate_global_bbox(tx, ty, mx, my, "width")
+            return bbox[2] - bbox[0]
+            
+        def alto(tx, ty):
+            bbox = scene.calculate_global_bbox(tx, ty, mx, my, "width")
+            return bbox[3] - bbox[1]
+            
+        tx_min = 1
+        while ancho(tx_min, 1) < x_min:
+            tx_min += 1
+            if tx_min > 100:
+                return None
+        ty_min = 1
+        while alto(tx_min, ty_min) < y_min:
+            ty_min += 1
+            if ty_min > 100:
+                return None
+        tx_max = tx_min
+        while tx_max <= 100 and ancho(tx_max + 1, 1) <= x_max:
+            tx_max += 1
+        ty_max = ty_min
+        while ty_max <= 100 and alto(tx_max, ty_max + 1) <= y_max:
+            ty_max += 1
+        return (tx_min, ty_min, tx_max, ty_max)
+        
+    def test_first_tiles_count_matches_linear_scan(self):
+        """Test bisection against a linear scan for every threshold."""
+        for low, high in ((1, 100), (5, 101), (7, 7), (3, 2)):
+            for threshold in range(0, 104):
+                predicate = lambda n, t=threshold: n >= t
+                expected = self._linear_first(predicate, low, high)
+                assert LayoutOptimizer._first_tiles_count(predicate, low, high) == expected
+                
+    def test_first_tiles_count_none_true(self):
+        """Test that high + 1 is returned when no count satisfies the predicate."""
+        assert LayoutOptimizer._first_tiles_count(lambda n: False, 1, 100) == 101
+        assert LayoutOptimizer._first_tiles_count(lambda n: False, 1, 101) == 102
+        
+    def test_layout_bounds_match_linear_scan(self):
+        """Test layout bounds against the linear scans on several beds."""
+        beds = [
+            (10.0, 100.0, 10.0, 100.0),
+            (35.0, 60.0, 12.5, 80.0),
+            (7.0, 7.5, 3.0, 3.2),
+            (0.0, 1000.0, 0.0, 400.0),
+        ]
+        for scene in (LinearScene(7.0, 3.0), LinearScene(4.5, 2.25, skew=0.5)):
+            for bed in beds:
+                for mx, my in ((0.0, 0.0), (0.3, 0.7)):
+                    expected = self._linear_bounds(scene, *bed, mx, my)
+                    result = self.optimizer._calculate_layout_bounds(scene, *bed, mx, my, "width")
+                    assert result == expected, (bed, mx, my)
+                    
+    def test_layout_bounds_caps(self):
+        """Test the 100 tile limit on minimum counts and the 101 cap on maximum counts."""
+        scene = LinearScene(1.0, 1.0)
+        
+        # Needing more than 100 tiles to reach the minimum gives no layout
+        assert self.optimizer._calculate_layout_bounds(scene, 100.5, 500.0, 1.0, 10.0, 0.0, 0.0, "width") is None
+        assert self.optimizer._calculate_layout_bounds(scene, 1.0, 10.0, 100.5, 500.0, 0.0, 0.0, "width") is None
+        
+        # Exactly 100 tiles is still accepted; the maximum search stops one past it
+        assert self.optimizer._calculate_layout_bounds(scene, 100.0, 500.0, 100.0, 500.0, 0.0, 0.0, "width") == (100, 100, 101, 101)
+        assert self.optimizer._calculate_layout_bounds(scene, 100.0, 100.0, 100.0, 100.0, 0.0, 0.0, "width") == (100, 100, 100, 100)
+        
+        # A bed that fits everything caps the maximum counts at 101
+        assert self.optimizer._calculate_layout_bounds(scene, 1.0, 1e6, 1.0, 1e6, 0.0, 0.0, "width") == (1, 1, 101, 101)
+        
+    def test_intermediate_layout_matches_brute_force(self):
+        """Test divisor pairs against a scan over every (tx, ty) in range."""
+        for scene in (LinearScene(7.0, 3.0), LinearScene(4.5, 2.25, skew=3.0)):
+            for total in range(1, 61):
+                for bounds in ((1, 1, 12, 12), (2, 3, 6, 8), (4, 1, 4, 20)):
+                    tx_min, ty_min, tx_max, ty_max = bounds
+                    candidates = []
+                    for tx in range(tx_min, tx_max + 1):
+                        for ty in range(ty_min, ty_max + 1):
+                            if tx * ty == total:
+                                bbox = scene.calculate_global_bbox(tx, ty, 0.2, 0.1, "width")
+                                candidates.append(((bbox[2] - bbox[0]) * (bbox[3] - bbox[1]), tx, ty))
+                    if candidates:
+                        area, tx, ty = min(candidates, key=lambda c: c[0])
+                        expected = (tx, ty)
+                    else:
+                        expected = (tx_max, ty_max)
+                    result = self.optimizer._find_intermediate_layout(
+                        scene, tx_min, ty_min, tx_max, ty_max, total, 0.2, 0.1, "width"
+                    )
+                    assert result == expected, (total, bounds)
+
+
+class TestNestingEngine:
+    """Test nesting engine results, caches and pattern store."""
+    
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.params = PlanoParams()
+        self.engine = NestingEngine(self.params)
+        
+    def _count_searches(self, monkeypatch):
+        """Wrap the full search and return the list of calls made."""
+        calls = []
+        search = self.engine._search_patterns
+        
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return search(*args, **kwargs)
+            
+        monkeypatch.setattr(self.engine, "_search_patterns", counting)
+        return calls
+        
+    @staticmethod
+    def _full_scan_bbox(pattern_data, tiles_x, tiles_y, medianil_x, medianil_y):
+        """Reference: union of the boxes of every tile in every row."""
+        poly1 = pattern_data['poly1']
+        poly2T = pattern_data['poly2T']
+        poly3T = pattern_data['poly3T']
+        dx2, dy2 = pattern_data['dx2'], pattern_data['dy2']
+        dx3, dy3 = pattern_data['dx3'], pattern_data['dy3']
+        minx1, miny1, maxx1, maxy1 = poly1.aabb()
+        vertical_offset = (maxy1 - miny1) + medianil_y
+        
+        boxes = []
+        for row in range(tiles_y):
+            row_offset_y = row * vertical_offset
+            for col in range(tiles_x):
+                if col == 0:
+                    poly, offset_x, offset_y = poly1, 0.0, row_offset_y
+                elif col == 1:
+                    poly, offset_x, offset_y = poly2T, dx2 + medianil_x, dy2 + row_offset_y
+                elif col == 2:
+                    poly, offset_x, offset_y = poly3T, dx3 + 2 * medianil_x, dy3 + row_offset_y
+                elif col % 2 == 1:
+                    prev_x = dx3 * ((col - 1) // 2) + (col - 1) * medianil_x
+                    prev_y = dy3 * ((col - 1) // 2)
+                    poly, offset_x, offset_y = poly2T, prev_x + dx2 + medianil_x, prev_y + dy2 + row_offset_y
+                else:
+                    prev_x = dx2 + dx3 * ((col - 2) // 2) + (col - 1) * medianil_x
+                    prev_y = dy2 + dy3 * ((col - 2) // 2)
+                    poly, offset_x, offset_y = (poly3T, prev_x + (dx3 - dx2) + medianil_x,
+                                                prev_y + (dy3 - dy2) + row_offset_y)
+                minx, miny, maxx, maxy = poly.aabb()
+                boxes.append((minx + offset_x, miny + offset_y, maxx + offset_x, maxy + offset_y))
+                
+        return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes))
+        
+    def test_global_bbox_matches_full_scan(self):
+        """Test first/last row bounding box against the union over every row."""
+        for objective in ("width", "height"):
+            pattern_data = self.engine.calculate_optimal_nesting(3, 2, objective=objective)
+            assert pattern_data
+            for tiles_x in (1, 2, 3, 4, 5, 8):
+                for tiles_y in (1, 2, 3, 7):
+                    for medianil_x, medianil_y in ((0.0, 0.0), (0.4, 0.25)):
+                        expected = self._full_scan_bbox(pattern_data, tiles_x, tiles_y, medianil_x, medianil_y)
+                        result = self.engine.calculate_global_bbox(tiles_x, tiles_y, medianil_x, medianil_y, objective)
+                        assert result == pytest.approx(expected)
+                        
+    def test_global_bbox_fallback_without_pattern(self):
+        """Test the single tile fallback when nothing has been calculated."""
+        poly1, _ = build_aligned_tile_cm(self.params, 90)
+        assert self.engine.calculate_global_bbox(4, 3, 0.0, 0.0, "width") == poly1.aabb()
+        
+    def test_same_shape(self):
+        """Test shape equality regardless of the starting vertex."""
+        square = OrthoPoly([(0, 0), (2, 0), (2, 2), (0, 2)])
+        shifted = OrthoPoly([(2, 2), (0, 2), (0, 0), (2, 0)])
+        other = OrthoPoly([(0, 0), (3, 0), (3, 2), (0, 2)])
+        holed = OrthoPoly([(0, 0), (2, 0), (2, 2), (0, 2)], holes=[[(0.5, 0.5), (1, 0.5), (1, 1), (0.5, 1)]])
+        
+        assert _same_shape(square, shifted)
+        assert not _same_shape(square, other)
+        assert not _same_shape(square, holed)
+        assert _same_shape(holed, holed.translated(0, 0))
+        
+        # The default tile is not symmetric under 180 degrees
+        assert not _same_shape(build_aligned_tile_cm(self.params, 90)[0],
+                               build_aligned_tile_cm(self.params, 270)[0])
+        
+    @staticmethod
+    def _symmetric_params():
+        """Tile that maps onto itself under a 180 degree rotation."""
+        return PlanoParams(L=10.0, A=10.0, h=6.0, cIzq=1.5, cDer=1.5,
+                           Tapas=[3.0, 2.0, 3.0, 2.0], CSup=[1.0, 0.0, 1.0, 0.0],
+                           Bases=[2.0, 3.0, 2.0, 3.0], CInf=[0.0, 1.0, 0.0, 1.0])
+        
+    def test_symmetric_skip_matches_full_search(self, monkeypatch):
+        """Test that skipping rotation 270 gives the same result as searching it."""
+        params = self._symmetric_params()
+        assert _same_shape(build_aligned_tile_cm(params, 90)[0], build_aligned_tile_cm(params, 270)[0])
+        
+        skipped = NestingEngine(params)._search_patterns(0.5, 0.1, 0.0, ("width", "height"))
+        monkeypatch.setattr(engine_module, "_same_shape", lambda a, b: False)
+        full = NestingEngine(params)._search_patterns(0.5, 0.1, 0.0, ("width", "height"))
+        
+        for objective in ("width", "height"):
+            assert skipped[objective] is not None
+            assert skipped[objective][0] == full[objective][0]
+            assert skipped[objective][1:3] == pytest.approx(full[objective][1:3])
+            
+    def test_pattern_store_restores_without_search(self, monkeypatch):
+        """Test that a cleared cache is refilled from the pattern store."""
+        calls = self._count_searches(monkeypatch)
+        first = self.engine.calculate_optimal_nesting(3, 2, objective="width")
+        assert len(calls) == 1
+        
+        self.engine.nesting_cache_width.clear()
+        restored = self.engine.calculate_optimal_nesting(3, 2, objective="width")
+        assert len(calls) == 1
+        assert restored['dx2'] == first['dx2'] and restored['dy3'] == first['dy3']
+        
+        # Served straight from the objective cache afterwards
+        assert self.engine.calculate_optimal_nesting(3, 2, objective="width") is restored
+        assert len(calls) == 1
+        
+    def test_force_recalculate_skips_pattern_store(self, monkeypatch):
+        """Test that force_recalculate always runs the search."""
+        calls = self._count_searches(monkeypatch)
+        self.engine.calculate_optimal_nesting(3, 2, objective="width")
+        self.engine.calculate_optimal_nesting(3, 2, objective="width", force_recalculate=True)
+        assert len(calls) == 2
+        
+        self.engine.generate_caches(3, 2, objectives=("width", "height"))
+        assert len(calls) == 3
+        self.engine.generate_caches(3, 2, objectives=("width", "height"))
+        assert len(calls) == 3
+        self.engine.generate_caches(3, 2, objectives=("width", "height"), force_recalculate=True)
+        assert len(calls) == 4
+        
+    def test_clear_pattern_store(self, monkeypatch):
+        """Test that clearing the store forces a new search."""
+        calls = self._count_searches(monkeypatch)
+        self.engine.calculate_optimal_nesting(3, 2, objective="height")
+        self.engine.nesting_cache_height.clear()
+        self.engine.clear_pattern_store()
+        self.engine.calculate_optimal_nesting(3, 2, objective="height")
+        assert len(calls) == 2
+        
+    def test_in_place_edit_invalidates_cache(self):
+        """Test that touch() after an in-place edit invalidates the cached pattern."""
+        self.engine.calculate_optimal_nesting(3, 2, objective="width")
+        assert self.engine._render_from_cache(3, 2, 0.0, 0.0, "width")
+        
+        self.params.h += 1.0
+        self.params.touch()
+        assert not self.engine._render_from_cache(3, 2, 0.0, 0.0, "width")
+
+
 class TestProductionParameters:
     """Test cases for production parameters."""
     